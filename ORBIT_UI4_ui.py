@@ -21,7 +21,6 @@ from PySide6.QtWidgets import (QApplication, QComboBox, QDockWidget, QFrame,
     QSlider, QSpacerItem, QSplitter, QStackedWidget,
     QTabWidget, QTextEdit, QVBoxLayout, QWidget)
 import Orbit_rc
-import Orbit_rc
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -33,79 +32,8 @@ class Ui_MainWindow(object):
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
         MainWindow.setSizePolicy(sizePolicy)
-        MainWindow.setStyleSheet(u"/* Existing styles */\n"
-"background-color: rgb(0, 64, 122);\n"
-"\n"
-"QPushButton {\n"
-"    background-color: rgb(139, 139, 139); /* Gray background */\n"
-"    color: white;                         /* White text */\n"
-"    border-style: solid;\n"
-"    border-width: 2px;\n"
-"    border-color: #4CAF50;\n"
-"    border-radius: 10px;                  /* Rounded corners */\n"
-"    padding: 10px;\n"
-"    font-size: 16px;\n"
-"}\n"
-"QPushButton:hover {\n"
-"    background-color: #00407A;            /* Darker green background on hover */\n"
-"}\n"
-"QTabWidget::pane { /* The tab widget frame */\n"
-"    border-top: 2px solid #C2C7CB;\n"
-"    position: absolute;\n"
-"    top: -0.5em;\n"
-"    color: #333333;\n"
-"    background-color: #f0f0f0;\n"
-"    border-radius: 5px;\n"
-"}\n"
-"QTabBar::tab {\n"
-"    background: #E1E1E1;\n"
-"    border: 2px solid #C4C4C3;\n"
-"    border-bottom-color: #C2C7CB; /* Same as pane color */\n"
-"    border-top-left-radius: 4px;\n"
-"    border-top-right-radius: 4px;\n"
-"    padding: 5px;\n"
-"}\n"
-"QT"
-                        "abBar::tab:selected, QTabBar::tab:hover {\n"
-"    background: #fafafa;\n"
-"}\n"
-"\n"
-"/* Added styles for QDockWidget */\n"
-"QDockWidget {\n"
-"    border: 1px solid #d3d3d3; /* Light gray border */\n"
-"    border-radius: 5px;        /* Rounded corners */\n"
-"    background-color: rgba(255, 255, 255, 0.9); /* White background with slight transparency */\n"
-"    titlebar-close-icon: url(close.png);\n"
-"    titlebar-normal-icon: url(undock.png);\n"
-"}\n"
-"QDockWidget::title {\n"
-"    text-align: left;          /* Aligns title text to the left */\n"
-"    background-color: rgba(0, 64, 122, 0.85); /* Slightly transparent background for the title */\n"
-"    padding: 5px;\n"
-"    border-radius: 5px 5px 0 0; /* Rounded corners on the top */\n"
-"}\n"
-"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"\n"
-"/* QSplitter styles */\n"
-"QSplitter::handle {\n"
-"    background-color: #54BCEB;\n"
-"    border: 1px solid #54BCEB;\n"
-"    border-radius: 1px;\n"
-""
-                        "}\n"
-"QSplitter::handle:hover {\n"
-"    background-color: #54BCEB;\n"
-"}\n"
-"\n"
-"")
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
-        self.centralwidget.setStyleSheet(u"")
         self.mainHorizontalLayout = QHBoxLayout(self.centralwidget)
         self.mainHorizontalLayout.setSpacing(0)
         self.mainHorizontalLayout.setObjectName(u"mainHorizontalLayout")
@@ -114,59 +42,6 @@ class Ui_MainWindow(object):
         self.leftPanelLayout.setObjectName(u"leftPanelLayout")
         self.leftPanelStackedWidget = QStackedWidget(self.centralwidget)
         self.leftPanelStackedWidget.setObjectName(u"leftPanelStackedWidget")
-        self.leftPanelStackedWidget.setStyleSheet(u"QTabWidget::pane { /* The tab widget frame */\n"
-"    border-top: 2px solid #C2C7CB;\n"
-"    position: absolute;\n"
-"    top: -0.5em;\n"
-"    color: #333333;\n"
-"    background-color: #f0f0f0;\n"
-"    border-radius: 5px;\n"
-"}\n"
-"QTabBar::tab {\n"
-"    background: #E1E1E1;\n"
-"    border: 2px solid #C4C4C3;\n"
-"    border-bottom-color: #C2C7CB; /* Same as pane color */\n"
-"    border-top-left-radius: 4px;\n"
-"    border-top-right-radius: 4px;\n"
-"    padding: 5px;\n"
-"}\n"
-"\n"
-"QTabBar::tab:selected {\n"
-"    background: #2e8b57; /* New distinct color for active tab */\n"
-"    color: white;\n"
-"    border-color: #2e8b57; /* Optional: change the border color to match */\n"
-"}\n"
-"\n"
-"\n"
-"\n"
-"QPushButton {\n"
-"    border-style: solid;\n"
-"    border-width: 2px;\n"
-"    border-color: #54BCEB;                /* New button border color */\n"
-"    border-radius: 10px;                  /* Rounded corners */\n"
-"    background-color: transparent;        /* Transparent background */\n"
-"    color: white;          "
-                        "               /* White text */\n"
-"    padding: 10px;\n"
-"    font-size: 16px;\n"
-"}\n"
-"QPushButton:disabled {\n"
-"    background-color: #676767;            /* Disabled button color */\n"
-"    border-color: #8B8B8B;                /* Disabled button border color */\n"
-"}\n"
-"QPushButton:hover {\n"
-"    background-color: #00407A;            /* Dark blue background on hover */\n"
-"}\n"
-"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"QLabel {\n"
-"    color: white;\n"
-"	font-size: 12px\n"
-"}")
         self.tab0ButtonsPage = QWidget()
         self.tab0ButtonsPage.setObjectName(u"tab0ButtonsPage")
         self.tab0Layout = QVBoxLayout(self.tab0ButtonsPage)
@@ -186,10 +61,6 @@ class Ui_MainWindow(object):
 
         self.label = QLabel(self.tab0ButtonsPage)
         self.label.setObjectName(u"label")
-        self.label.setStyleSheet(u"QLabel {\n"
-"    background-color: #40C4FF;\n"
-"    border: none;\n"
-"}")
         self.label.setPixmap(QPixmap(u":/icons/icons/Sponsors.png"))
 
         self.tab0Layout.addWidget(self.label)
@@ -213,51 +84,22 @@ class Ui_MainWindow(object):
 
         self.textEdit = QTextEdit(self.tab0ButtonsPage)
         self.textEdit.setObjectName(u"textEdit")
-        self.textEdit.setEnabled(True)
-        self.textEdit.setStyleSheet(u"QTextEdit {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"}")
         self.textEdit.setReadOnly(True)
 
         self.tab0Layout.addWidget(self.textEdit)
 
         self.btn_tab0_LoadBridgeData = QPushButton(self.tab0ButtonsPage)
         self.btn_tab0_LoadBridgeData.setObjectName(u"btn_tab0_LoadBridgeData")
-        self.btn_tab0_LoadBridgeData.setEnabled(True)
-        self.btn_tab0_LoadBridgeData.setStyleSheet(u"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"")
 
         self.tab0Layout.addWidget(self.btn_tab0_LoadBridgeData)
 
         self.btn_tab0_updateData = QPushButton(self.tab0ButtonsPage)
         self.btn_tab0_updateData.setObjectName(u"btn_tab0_updateData")
-        self.btn_tab0_updateData.setEnabled(True)
-        self.btn_tab0_updateData.setStyleSheet(u"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"")
 
         self.tab0Layout.addWidget(self.btn_tab0_updateData)
 
         self.btn_tab0_ConfirmProjectData = QPushButton(self.tab0ButtonsPage)
         self.btn_tab0_ConfirmProjectData.setObjectName(u"btn_tab0_ConfirmProjectData")
-        self.btn_tab0_ConfirmProjectData.setEnabled(True)
-        self.btn_tab0_ConfirmProjectData.setStyleSheet(u"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"")
 
         self.tab0Layout.addWidget(self.btn_tab0_ConfirmProjectData)
 
@@ -295,7 +137,6 @@ class Ui_MainWindow(object):
 
         self.trajectoryGroupBox = QGroupBox(self.tab1ButtonsPage)
         self.trajectoryGroupBox.setObjectName(u"trajectoryGroupBox")
-        self.trajectoryGroupBox.setStyleSheet(u"QGroupBox { color: white; font-weight: bold; }")
         self.trajectoryLayout = QVBoxLayout(self.trajectoryGroupBox)
         self.trajectoryLayout.setObjectName(u"trajectoryLayout")
         self.btn_tab1_DrawTrajectory = QPushButton(self.trajectoryGroupBox)
@@ -463,14 +304,6 @@ class Ui_MainWindow(object):
 
         self.btn_tab1_build_model = QPushButton(self.tab1ButtonsPage)
         self.btn_tab1_build_model.setObjectName(u"btn_tab1_build_model")
-        self.btn_tab1_build_model.setEnabled(True)
-        self.btn_tab1_build_model.setStyleSheet(u"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"")
 
         self.tab1Layout.addWidget(self.btn_tab1_build_model)
 
@@ -540,27 +373,11 @@ class Ui_MainWindow(object):
 
         self.btn_tab2_Dock_updateOverviewFlight = QPushButton(self.tab2ButtonsPage)
         self.btn_tab2_Dock_updateOverviewFlight.setObjectName(u"btn_tab2_Dock_updateOverviewFlight")
-        self.btn_tab2_Dock_updateOverviewFlight.setEnabled(True)
-        self.btn_tab2_Dock_updateOverviewFlight.setStyleSheet(u"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"")
 
         self.tab2Layout.addWidget(self.btn_tab2_Dock_updateOverviewFlight)
 
         self.btn_tab2_Dock_updateInspectionRoute = QPushButton(self.tab2ButtonsPage)
         self.btn_tab2_Dock_updateInspectionRoute.setObjectName(u"btn_tab2_Dock_updateInspectionRoute")
-        self.btn_tab2_Dock_updateInspectionRoute.setEnabled(True)
-        self.btn_tab2_Dock_updateInspectionRoute.setStyleSheet(u"\n"
-"QToolTip {\n"
-"    color: white;\n"
-"    background-color:rgb(0, 64, 122);\n"
-"    border: 1px solid white;\n"
-"}\n"
-"")
 
         self.tab2Layout.addWidget(self.btn_tab2_Dock_updateInspectionRoute)
 
@@ -573,10 +390,6 @@ class Ui_MainWindow(object):
 
         self.WaypointsTextBox = QTextEdit(self.tab2ButtonsPage)
         self.WaypointsTextBox.setObjectName(u"WaypointsTextBox")
-        self.WaypointsTextBox.setStyleSheet(u"QTextEdit {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"}")
         self.WaypointsTextBox.setReadOnly(True)
 
         self.tab2Layout.addWidget(self.WaypointsTextBox)
@@ -609,12 +422,7 @@ class Ui_MainWindow(object):
         sizePolicy3.setHeightForWidth(self.WaypointsQLineEdit.sizePolicy().hasHeightForWidth())
         self.WaypointsQLineEdit.setSizePolicy(sizePolicy3)
         self.WaypointsQLineEdit.setLayoutDirection(Qt.LeftToRight)
-        self.WaypointsQLineEdit.setStyleSheet(u"QLineEdit {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    font-size: 12px;\n"
-"	color: white;  \n"
-"}")
+        self.WaypointsQLineEdit.setText(u"0")
         self.WaypointsQLineEdit.setAlignment(Qt.AlignCenter)
 
         self.tab2Layout.addWidget(self.WaypointsQLineEdit)
@@ -670,9 +478,39 @@ class Ui_MainWindow(object):
         self.tab0ContentLayout.setObjectName(u"tab0ContentLayout")
         self.tab0_textEdit1_Photo = QTextEdit(self.tab_0)
         self.tab0_textEdit1_Photo.setObjectName(u"tab0_textEdit1_Photo")
-        self.tab0_textEdit1_Photo.setStyleSheet(u"QTextEdit {\n"
-"  border: none;\n"
-"}")
+        self.tab0_textEdit1_Photo.setHtml(u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt;\">\n"
+"<p align=\"center\" style=\" font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Project Information</span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">bridge_name = </span><span style=\" font-size:11pt; color:#0af;\">TestBridge </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"># Input data should have {</span><span style=\" font-size:11pt; color:#e7e7e7;\">bridge_name</span><span style=\" font-size:11pt; color:#6a9955;\">}</span><span style=\" font-size:11pt; color:#e7e7e7;\"> </span><span style=\" font-size:11pt; color:#6a9955;\">and be in</span><span style=\" font-size:11pt; color:#e7e7e7;\"> impor"
+                        "t_dir</span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">import_dir = </span><span style=\" font-size:11pt; color:#0af;\">C:\\Code\\_Orbitv1.2.2\\01_ImportFolder</span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">project_dir_base = </span><span style=\" font-size:11pt; color:#0af;\">C:\\Code\\_Orbitv1.2.2\\02_FlightRoutes </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"># base for the project output</span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">conda_environment = Orbit</span><span style=\" font-size:11pt; color:#0af;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"># conda info --envs</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty;\"><br /></p>\n"
+"<p><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Trajectory </span><span style=\" font-size:11pt; text-decoration: underline; color:#e7e7e7;\">(If no import da"
+                        "ta available)</span><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">: </span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">trajectory_heights = </span><span style=\" font-size:11pt; color:#0af;\">[6.4, 6.4] </span><span style=\" font-size:11pt; color:#6a9955;\"># Approx. height of bridge trajectory above starting point, quadratic approx. </span></p>\n"
+"<p><span style=\" font-family:'Aptos,sans-serif'; font-size:11pt; color:#e7e7e7;\">ground_elevation</span><span style=\" font-size:11pt; color:#e7e7e7;\"> = </span><span style=\" font-size:11pt; color:#0af;\">0 </span><span style=\" font-size:11pt; color:#6a9955;\"># Purely cosmetic. Defines pillar base altitude. </span></p>\n"
+"<p style=\"-qt-paragraph-type:empty;\"><br /></p>\n"
+"<p><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Coordinate system:</span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">coordinate_system = </span><span style=\" fo"
+                        "nt-size:11pt; color:#0af;\">WGS84 </span><span style=\" font-size:11pt; color:#6a9955;\"># </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\">Lambert2008, Lambert72, or any EPSG code </span></p>\n"
+"<p><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#e7e7e7;\">heightStartingPoint_Ellipsoid</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#e7e7e7;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#0af;\">0</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span style=\" c"
+                        "olor:#e7e7e7;\">heightStartingPoint_Reference</span><span style=\" color:#9cdcfe;\"> </span><span style=\" color:#e7e7e7;\">=</span><span style=\" color:#9cdcfe;\"> </span><span style=\" color:#0af;\">0</span><span style=\" color:#ce9178;\"> </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:6pt;\"><span style=\" color:#ce9178;\"> </span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Cross-section:</span></p>\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">input_scale_meters = </span><span style=\" font-size:11pt; color:#0af;\">17.279 </span><span style=\" font-size:11pt; color:#6a9955;\"># Mark one distance in green. bridge_width is the largest distance across.</span></p>"
+                        "\n"
+"<p><span style=\" font-size:11pt; color:#e7e7e7;\">epsilonInput =</span><span style=\" font-size:11pt; color:#0af;\"> 0.003 </span><span style=\" font-size:11pt; color:#6a9955;\"># Smaller value is tighter fit</span></p>\n"
+"<p><span style=\" font-size:6pt; color:#6a9955;\"> </span><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Imported data:</span></p>\n"
+"<p><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">trajectory_points_count = 0</span></p>\n"
+"<p><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">pillars_count = 0</span></p>\n"
+"<p><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">trajectory_length = 0</span></p>\n"
+"<p><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">average_pillar_height = 0</span></p></body></html>")
 
         self.tab0ContentLayout.addWidget(self.tab0_textEdit1_Photo)
 
@@ -685,9 +523,6 @@ class Ui_MainWindow(object):
 
         self.graphicsView_crosssection_2 = QGraphicsView(self.tab_0)
         self.graphicsView_crosssection_2.setObjectName(u"graphicsView_crosssection_2")
-        self.graphicsView_crosssection_2.setStyleSheet(u"QGraphicsView {\n"
-"  border: none;\n"
-"}")
 
         self.tab0ContentLayout.addWidget(self.graphicsView_crosssection_2)
 
@@ -698,6 +533,8 @@ class Ui_MainWindow(object):
         self.tab1ContentLayout.setObjectName(u"tab1ContentLayout")
         self.tab1_QWebEngineView = QLabel(self.tab_1)
         self.tab1_QWebEngineView.setObjectName(u"tab1_QWebEngineView")
+        self.tab1_QWebEngineView.setText(u"Map Widget Area\n"
+"(QWebEngineView would be inserted here via layout)")
         self.tab1_QWebEngineView.setAlignment(Qt.AlignCenter)
 
         self.tab1ContentLayout.addWidget(self.tab1_QWebEngineView)
@@ -720,11 +557,12 @@ class Ui_MainWindow(object):
         sizePolicy5.setHeightForWidth(self.Placeholder2.sizePolicy().hasHeightForWidth())
         self.Placeholder2.setSizePolicy(sizePolicy5)
         self.Placeholder2.setMinimumSize(QSize(0, 200))
+        self.Placeholder2.setText(u"3D Visualization Area\n"
+"(This would contain your visualization widget)")
         self.Placeholder2.setAlignment(Qt.AlignCenter)
         self.verticalSplitter.addWidget(self.Placeholder2)
         self.dockWidget_FR = QDockWidget(self.verticalSplitter)
         self.dockWidget_FR.setObjectName(u"dockWidget_FR")
-        self.dockWidget_FR.setEnabled(True)
         sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         sizePolicy6.setHorizontalStretch(0)
         sizePolicy6.setVerticalStretch(1)
@@ -734,184 +572,113 @@ class Ui_MainWindow(object):
         self.dockWidget_FR.setMaximumSize(QSize(524287, 524287))
         self.dockWidget_FR.setVisible(False)
         self.dockWidget_FR.setAutoFillBackground(False)
-        self.dockWidget_FR.setStyleSheet(u"/* Base application background */\n"
-"* {\n"
-"    background-color: rgba(103, 103, 103, 0.9);  /* Uniform background color for all widgets */\n"
-"    color: white;  /* Ensures text is visible against the darker background */\n"
-"}\n"
-"\n"
-"QPushButton {\n"
-"    background-color: rgb(139, 139, 139); /* Gray background */\n"
-"    color: white;                         /* White text */\n"
-"    border-style: solid;\n"
-"    border-width: 2px;\n"
-"    border-color: #4CAF50;\n"
-"    border-radius: 10px;                  /* Rounded corners */\n"
-"    padding: 10px;\n"
-"    font-size: 16px;\n"
-"}\n"
-"QPushButton:hover {\n"
-"    background-color: #45a049;            /* Darker green background on hover */\n"
-"}\n"
-"\n"
-"QTabWidget::pane { /* The tab widget frame */\n"
-"    border-top: 2px solid #C2C7CB;\n"
-"    position: absolute;\n"
-"    top: -0.5em;\n"
-"    color: #333333;\n"
-"    background-color: #f0f0f0;\n"
-"    border-radius: 5px;\n"
-"}\n"
-"\n"
-"QTabBar::tab {\n"
-"    background: #E1E1E1;\n"
-"    border: 2px solid #"
-                        "C4C4C3;\n"
-"    border-bottom-color: #C2C7CB; /* Same as pane color */\n"
-"    border-top-left-radius: 4px;\n"
-"    border-top-right-radius: 4px;\n"
-"    padding: 5px;\n"
-"}\n"
-"\n"
-"QTabBar::tab:selected, QTabBar::tab:hover {\n"
-"    background: #fafafa;\n"
-"}\n"
-"\n"
-"QDockWidget {\n"
-"    border: 1px solid #d3d3d3; /* Light gray border */\n"
-"    border-radius: 5px;        /* Rounded corners */\n"
-"    background-color: rgba(255, 255, 255, 0.9); /* White background with slight transparency */\n"
-"}\n"
-"\n"
-"QDockWidget::title {\n"
-"    text-align: left;          /* Aligns title text to the left */\n"
-"    background-color: rgba(0, 64, 122, 0.85); /* Slightly transparent background for the title */\n"
-"    padding: 5px;\n"
-"    border-radius: 5px 5px 0 0; /* Rounded corners on the top */\n"
-"}\n"
-"\n"
-"QTextEdit {\n"
-"    border: 1px solid #888; /* Slightly lighter border for visibility */\n"
-"    border-radius: 5px;  /* Rounded corners */\n"
-"    padding: 2px;\n"
-"}\n"
-"\n"
-"QCheckBox {\n"
-"    spacing: 5px"
-                        "; /* Space between the checkbox and its label */\n"
-"}\n"
-"\n"
-"QCheckBox::indicator {\n"
-"    width: 20px;\n"
-"    height: 20px;\n"
-"    background-color: #888; /* Match background color */\n"
-"    border-radius: 5px; /* Rounded corners */\n"
-"}\n"
-"\n"
-"QCheckBox::indicator:checked {\n"
-"    background-color: #45a049; /* Green for checked state */\n"
-"}\n"
-"\n"
-"QCheckBox::indicator:unchecked {\n"
-"    background-color: #bbb; /* Lighter grey for unchecked state */\n"
-"}\n"
-"/* Styling for Horizontal Sliders */\n"
-"QSlider::groove:horizontal {\n"
-"    border: 1px solid #555;  /* Dark grey border for better contrast */\n"
-"    height: 10px;            /* Slightly thicker groove for better visibility */\n"
-"    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #888, stop:1 #bbb); /* Gradient from darker to lighter grey */\n"
-"    margin: 2px 0;\n"
-"    border-radius: 5px;     /* Soft rounded corners for the groove */\n"
-"}\n"
-"\n"
-"QSlider::handle:horizontal {\n"
-"    background: qlineargradient(x1:0, "
-                        "y1:0, x2:1, y2:1, stop:0 #eee, stop:1 #ccc); /* Light grey gradient for the handle */\n"
-"    border: 1px solid #333; /* Dark border for the handle for better visibility */\n"
-"    width: 18px;            /* Width of the handle */\n"
-"    margin: -2px 0;         /* Allows handle to overlap the groove slightly */\n"
-"    border-radius: 9px;     /* Rounded handle for a smoother look */\n"
-"    position: absolute;     /* Ensures the handle is correctly positioned over the groove */\n"
-"}\n"
-"\n"
-"QSlider::handle:horizontal:hover {\n"
-"    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #fff, stop:1 #ddd); /* Brighter gradient for hover effect */\n"
-"    border-color: #080;     /* Greenish border on hover for visual feedback */\n"
-"}\n"
-"\n"
-"/* Styling for Vertical Sliders */\n"
-"QSlider::groove:vertical {\n"
-"    border: 1px solid #555;\n"
-"    width: 10px;            /* Consistent width with horizontal */\n"
-"    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #888, stop:1 #bbb);\n"
-"    m"
-                        "argin: 0 2px;\n"
-"    border-radius: 5px;\n"
-"}\n"
-"\n"
-"QSlider::handle:vertical {\n"
-"    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #eee, stop:1 #ccc);\n"
-"    border: 1px solid #333;\n"
-"    height: 18px;           /* Height matching the horizontal handle's width */\n"
-"    margin: 0 -2px;\n"
-"    border-radius: 9px;\n"
-"}\n"
-"\n"
-"QSlider::handle:vertical:hover {\n"
-"    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #fff, stop:1 #ddd);\n"
-"    border-color: #080;\n"
-"}\n"
-"\n"
-"\n"
-"QDockWidget {\n"
-"    border: 1px solid #d3d3d3;\n"
-"    border-radius: 10px;\n"
-"    background-color: rgb(103, 103, 103);\n"
-"}\n"
-"\n"
-"QDockWidget::title {\n"
-"    font-size: 10pt;\n"
-"    padding: 8px;\n"
-"    background-color: rgba(0, 64, 122, 0.85);\n"
-"    border-top-left-radius: 10px;\n"
-"    border-top-right-radius: 10px;\n"
-"    color: white;\n"
-"    font-weight: bold;\n"
-"}\n"
-"\n"
-"QDockWidget > QWidget {\n"
-"    border-top-left-radius: 10px;\n"
-"    border-top-right-radius: 10px;\n"
-""
-                        "border: 1px solid #d3d3d3;\n"
-"    border-radius: 10px;\n"
-"   background-color: rgb(103, 103, 103); /* Maintain transparency to see the dock's styling */\n"
-"}\n"
-"\n"
-"\n"
-"\n"
-"\n"
-"\n"
-"\n"
-"")
         self.dockWidget_FR.setFloating(False)
         self.dockWidget_FR.setFeatures(QDockWidget.DockWidgetFloatable)
         self.dockWidget_FR.setAllowedAreas(Qt.AllDockWidgetAreas)
         self.dockWidgetContents_FR = QWidget()
         self.dockWidgetContents_FR.setObjectName(u"dockWidgetContents_FR")
-        self.dockWidgetContents_FR.setEnabled(True)
         sizePolicy7 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         sizePolicy7.setHorizontalStretch(0)
         sizePolicy7.setVerticalStretch(0)
         sizePolicy7.setHeightForWidth(self.dockWidgetContents_FR.sizePolicy().hasHeightForWidth())
         self.dockWidgetContents_FR.setSizePolicy(sizePolicy7)
-        self.dockWidgetContents_FR.setStyleSheet(u"")
         self.horizontalLayout = QHBoxLayout(self.dockWidgetContents_FR)
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.tab3_textEdit = QTextEdit(self.dockWidgetContents_FR)
         self.tab3_textEdit.setObjectName(u"tab3_textEdit")
-        sizePolicy7.setHeightForWidth(self.tab3_textEdit.sizePolicy().hasHeightForWidth())
-        self.tab3_textEdit.setSizePolicy(sizePolicy7)
+        self.tab3_textEdit.setHtml(u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+".kw { color:#9cdcfe; }\n"
+".str { color:#ce9178; }\n"
+".num { color:#b5cea8; }\n"
+".cmt { color:#4eea00; }\n"
+".op { color:#d4d4d4; }\n"
+".txt { color:#ccc; }\n"
+"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt;\">\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Overview Flight: </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"kw\" style=\" font-family:'Consolas,Courier New,monospace';\">order</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\"> </span><span class=\"op\" style=\" font-family:'Consolas,Courier New,monospace';\">=</span><span class=\"txt\" style=\" font-family:'Consolas,Courie"
+                        "r New,monospace';\"> [</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;101&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">, </span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;r101&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;102&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;r102&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;103&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'"
+                        ";\">&quot;r103&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"kw\">transition_mode</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;201&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">, </span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;r201&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;202&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">, </span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;r202&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">,</span><span class=\"str\" style=\" font-family:'Conso"
+                        "las,Courier New,monospace';\">&quot;203&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">, </span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace';\">&quot;r203&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace';\">] </span><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace';\"># 1=right side, r=reverse. useing offsets as in </span><span class=\"kw\" style=\" font-family:'Consolas,Courier New,monospace';\">standard_flight_routes (</span><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace';\">below)</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"kw\">transition_mode</span><span style=\" color:#e7e7e7;\"> = </span><span class=\"str\">2</span><span style=\" color:#e7e7e7;\"> </span><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace';\"># 0 = separate right and left side, 1=pass middle, 2=after last segmen"
+                        "t</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">transition_vertical_offset = </span><span class=\"str\">15 </span><span class=\"cmt\"># Or underneath e.g. -6 </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">transition_horizontal_offset = </span><span class=\"str\">15</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Safety Zones:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px;\"><span class=\"kw\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">safety_zones_clearance</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"> </span><span class=\"o"
+                        "p\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">=</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"> </span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">[[0,25],[0,25],[0,25]]</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"> </span><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">#min, max local. default 0,35 m</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><br /></span><span class=\"kw\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">safety_zones_clearance_adjust</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"> </span><span class=\"op\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">=</span><span class=\"txt\" style=\" font-family:'Consolas"
+                        ",Courier New,monospace'; font-size:11pt;\"> </span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">[[25],[25],[25]]</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"> </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"cmt\"># adjust points inside zones. 0 = delete points, -1 find closest exit</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Underdeck Flights: </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">num_points</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> </span><span class=\"str\">[3, 7, 3]</span>"
+                        "<span class=\"txt\"> </span><span class=\"cmt\"># Base points per section </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">horizontal_offsets_underdeck</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> </span><span class=\"str\">[8, 8, 8]</span><span class=\"cmt\"># H_Offest of base points </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">height_offsets_underdeck</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> </span><span class=\"str\">[[5, 5, 5], [5, 5, 5], [5, 5, 5]]</span><span class=\"txt\"> </span><span class=\"cmt\"># Vertical offset below trajectory (consider slab) using quadratic approx per base point.</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">ge"
+                        "neral_height_offset</span><span class=\"cmt\"> </span><span class=\"op\">=</span><span class=\"str\"> 1</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">thresholds_zones</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> </span><span class=\"str\">[(10, 10), (8, 8), (10, 10)]</span><span class=\"txt\"> </span><span class=\"cmt\"># Threshold distance </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace';\"><span class=\"kw\" style=\" font-size:11pt;\">custom_zone_angles = </span><span class=\"str\" style=\" font-size:11pt;\">[]</span><span class=\"txt\" style=\" font-size:11pt;\"> </span><span class=\"kw\" style=\" font-size:11pt;\"># </span><span class=\"cmt\" style=\" font-size:11pt;\">[2.16, 2.20, 2.24]</span><span class=\"txt\" style=\" font-size:8pt;\"> </span><span class=\"cmt\" style=\" font-size:11pt;\"># Adjust angle</span><"
+                        "/p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">connection_height </span><span class=\"op\">=</span><span class=\"str\"> 25</span><span class=\"num\">	</span><span class=\"cmt\"># vertical flight height for connections</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">num_passes</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> </span><span class=\"str\">2		</span><span class=\"cmt\"># num passes underdeck flighs</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">num_passes_middle</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> </span><span class=\"str\">4</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier "
+                        "New,monospace'; font-size:11pt; color:#6a9955;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Export Modus:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">heightMode = </span><span class=\"str\">EGM96 </span><span class=\"cmt\">#</span><span class=\"str\">relativeToStartPoint</span><span class=\"cmt\"> or EGM96</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">heightStartingPoint_Ellipsoid = </span><span class=\"str\">0 </span><span class=\"cmt\"># Typically </span><span class=\"str\">50.2 m </span><span class=\"cmt\">in Belgium.</span><span class=\"str\"> </span><span class=\"cmt\">Place drone on ground and read EXIF from image / RTK settings</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-f"
+                        "amily:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">heightStartingPoint_Reference = </span><span class=\"str\">0 </span><span class=\"cmt\"># Typically </span><span class=\"str\">8.0 m</span><span class=\"cmt\">.</span><span class=\"str\"> </span><span class=\"cmt\">Height in geolocated point cloud </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace';\"># Z waypoint= bridge trajectory (e.g. </span><span style=\" color:#e7e7e7;\">trajectory_heights)</span><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace';\"> + offsets + </span><span class=\"kw\" style=\" font-family:'Consolas,Courier New,monospace';\">heightStartingPoint_Ellipsoid - heightStartingPoint_Reference</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"><br /></p>\n"
+"<p style=\" margin-top:"
+                        "0px; margin-bottom:0px; font-size:11pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Additional Features:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">safety_check_photo </span><span class=\"op\">= </span><span class=\"str\">1</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">safety_check_underdeck </span><span class=\"op\">= </span><span class=\"str\">[[0],[0],[0]]</span><span class=\"op\"> </span><span class=\"cmt\"># 1 = execute safety check. </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">safety_check_underdeck_axial </span><span class=\"op\">= </span><span class=\"str\">[[0],[0],[0]]</span><span class=\"op\"> </span><span class=\"cmt\"># 1 = execute safety check.</span></p>\n"
+"<p sty"
+                        "le=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"kw\">n_girders</span><span style=\" color:#e7e7e7;\"> = </span><span class=\"str\">3</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"kw\">underdeck_split</span><span style=\" color:#e7e7e7;\"> = </span><span class=\"str\">1</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"kw\">underdeck_axial</span><span style=\" color:#e7e7e7;\"> = </span><span class=\"str\">0</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">droneEnumValue = </span><span class=\"str\">77 </span><span class=\"cmt\"># M3E = 77 </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">payloadEnumValue = </span><span class=\"str\">66 </span><span class=\"cmt\"># M3E = 66 </span></p>\n"
+"<p style=\" margin"
+                        "-top:0px; margin-bottom:0px; font-size:11pt;\"><span class=\"kw\" style=\" font-family:'Segoe WPC,Segoe UI,sans-serif';\">globalWaypointTurnMode</span><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; color:#d8dee9;\"> </span><span class=\"kw\" style=\" font-family:'Segoe WPC,Segoe UI,sans-serif';\">=</span><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; color:#d8dee9;\"> </span><span class=\"str\" style=\" font-family:'Segoe WPC,Segoe UI,sans-serif';\">toPointAndStopWithDiscontinuityCurvature </span><span class=\"cmt\" style=\" font-family:'Consolas,Courier New,monospace';\"># coordinateTurn, toPointAndStopWithContinuityCurvature, toPointAndPassWithContinuityCurvature</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">standard_fligh"
+                        "t_routes</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> {</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;101&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;vertical_offset&quot;</span><span class=\"txt\">: 12, </span><span class=\"str\">&quot;distance_offset&quot;</span><span class=\"txt\">: 12},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;102&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;vertical_offset&quot;</span><span class=\"txt\">: 8, </span><span class=\"str\">&quot;distance_offset&quot;</span><span class=\"txt\">: 8},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;103&quot;</span><span class=\"txt\">: {</span><spa"
+                        "n class=\"str\">&quot;vertical_offset&quot;</span><span class=\"txt\">: -2, </span><span class=\"str\">&quot;distance_offset&quot;</span><span class=\"txt\">: 7},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;201&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;vertical_offset&quot;</span><span class=\"txt\">: 12, </span><span class=\"str\">&quot;distance_offset&quot;</span><span class=\"txt\">: 12},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;202&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;vertical_offset&quot;</span><span class=\"txt\">: 8, </span><span class=\"str\">&quot;distance_offset&quot;</span><span class=\"txt\">: 8},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span "
+                        "class=\"str\">&quot;203&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;vertical_offset&quot;</span><span class=\"txt\">: -2, </span><span class=\"str\">&quot;distance_offset&quot;</span><span class=\"txt\">: 7}}</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ccc;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"kw\">flight_speed_map</span><span class=\"txt\"> </span><span class=\"op\">=</span><span class=\"txt\"> {</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;101&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">5</span><span class=\"txt\">},</span><span class=\"str\">&quot;102&quot;</span><span class=\""
+                        "txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">4</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;201&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">5</span><span class=\"txt\">},</span><span class=\"str\">&quot;202&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">4</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;103&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">2</span><span class=\"txt\">},</span><span class=\"str\">&quot;203&quo"
+                        "t;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">2</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;104&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">3</span><span class=\"txt\">},</span><span class=\"str\">&quot;105&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">2</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;204&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">3</span><span class=\"txt\">},</span><span clas"
+                        "s=\"str\">&quot;205&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">2</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px;\"><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">&quot;transition&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">: {</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">&quot;speed&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">: </span><span class=\"num\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">5</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">},<br /></span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">&quot;underdeck_span1&quot;</"
+                        "span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">: {</span><span class=\"str\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">&quot;speed&quot;</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">: </span><span class=\"num\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">0.8</span><span class=\"txt\" style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;underdeck_span2&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">0.85</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;underdeck_"
+                        "span3&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">0.8</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;connection&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">2.5</span><span class=\"txt\">},	 </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;axial_span1&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">1.0</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;axial_span2&quot;</span><span clas"
+                        "s=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">1.0</span><span class=\"txt\">},</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"str\">&quot;axial_span3&quot;</span><span class=\"txt\">: {</span><span class=\"str\">&quot;speed&quot;</span><span class=\"txt\">: </span><span class=\"num\">1.0</span><span class=\"txt\">}</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt;\"><span class=\"txt\">}}</span></p></body></html>")
 
         self.horizontalLayout.addWidget(self.tab3_textEdit)
 
@@ -968,6 +735,7 @@ class Ui_MainWindow(object):
         sizePolicy3.setHeightForWidth(self.text_slider_offset_X.sizePolicy().hasHeightForWidth())
         self.text_slider_offset_X.setSizePolicy(sizePolicy3)
         self.text_slider_offset_X.setLayoutDirection(Qt.LeftToRight)
+        self.text_slider_offset_X.setText(u"0")
         self.text_slider_offset_X.setAlignment(Qt.AlignCenter)
 
         self.verticalLayout.addWidget(self.text_slider_offset_X)
@@ -994,6 +762,7 @@ class Ui_MainWindow(object):
         sizePolicy3.setHeightForWidth(self.text_slider_offset_Y.sizePolicy().hasHeightForWidth())
         self.text_slider_offset_Y.setSizePolicy(sizePolicy3)
         self.text_slider_offset_Y.setLayoutDirection(Qt.LeftToRight)
+        self.text_slider_offset_Y.setText(u"0")
         self.text_slider_offset_Y.setAlignment(Qt.AlignCenter)
 
         self.verticalLayout.addWidget(self.text_slider_offset_Y)
@@ -1020,6 +789,7 @@ class Ui_MainWindow(object):
         sizePolicy3.setHeightForWidth(self.text_slider_offset_Z.sizePolicy().hasHeightForWidth())
         self.text_slider_offset_Z.setSizePolicy(sizePolicy3)
         self.text_slider_offset_Z.setLayoutDirection(Qt.LeftToRight)
+        self.text_slider_offset_Z.setText(u"0")
         self.text_slider_offset_Z.setAlignment(Qt.AlignCenter)
 
         self.verticalLayout.addWidget(self.text_slider_offset_Z)
@@ -1032,24 +802,6 @@ class Ui_MainWindow(object):
         self.btnToggleFR = QPushButton(self.verticalSplitter)
         self.btnToggleFR.setObjectName(u"btnToggleFR")
         self.btnToggleFR.setMinimumSize(QSize(9, 30))
-        self.btnToggleFR.setStyleSheet(u"\n"
-"QPushButton {\n"
-"    border-style: solid;\n"
-"    border-width: 2px;\n"
-"    border-color: #54BCEB;                /* New button border color */\n"
-"    border-radius: 10px;                  /* Rounded corners */\n"
-"    background-color: transparent;        /* Transparent background */\n"
-"    color: white;                         /* White text */\n"
-"    padding: 10px;\n"
-"    font-size:12px;\n"
-"}\n"
-"QPushButton:disabled {\n"
-"    background-color: #676767;            /* Disabled button color */\n"
-"    border-color: #8B8B8B;                /* Disabled button border color */\n"
-"}\n"
-"QPushButton:hover {\n"
-"    background-color: #00407A;            /* Dark blue background on hover */\n"
-"}")
         self.verticalSplitter.addWidget(self.btnToggleFR)
 
         self.tab2ContentLayout.addWidget(self.verticalSplitter)
@@ -1071,7 +823,6 @@ class Ui_MainWindow(object):
 
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"ORBIT v.1.2.2 - Optimized Routing for Bridge Inspection Toolkit  (Research only)", None))
-        self.tab0Label.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: white; font-weight: bold; text-align: center;", None))
         self.tab0Label.setText(QCoreApplication.translate("MainWindow", u"Project Setup", None))
         self.label.setText("")
 #if QT_CONFIG(tooltip)
@@ -1085,45 +836,43 @@ class Ui_MainWindow(object):
         self.textEdit.setHtml(QCoreApplication.translate("MainWindow", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
 "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
 "p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Workflow</span></p>\n"
-"<p align=\"center\" style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:10pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">1) P"
-                        "repare available data:</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">1.1) Select a bridge name, e.g. </span><span style=\" font-size:9pt; color:#00aaff;\">TestBridge</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">1.2) Prepare known trajectory points in 3D (e.g. using MeshLab, if model available) in TestBridge.txt file in the </span><span style=\" font-size:9pt; color:#00aaff;\">Import Directory</span><span style=\" font-size:9"
-                        "pt; color:#e7e7e7;\"> in the format:</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">Trajectory:</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100109.101562 195889.515625 13.793574]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100132.921875 195906.546875 14.485563]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100157.093750 195923.562500 14.700541]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-in"
-                        "dent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100182.257812 195941.484375 14.491943]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100208.867188 195960.093750 13.645084]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">Pillars:</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100133.992188 195914.203125 6.784123]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100134.429688 195900.734375 6.921566]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margi"
-                        "n-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100183.953125 195949.078125 7.142460]</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:8pt; color:#e7e7e7;\">[100184.062500 195936.015625 7.130339]</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">1.3) Prepare a technical drawing of a crosssection and give the inside a blue fill. </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">Mark the longest distance in green t"
-                        "o extract the scale = </span><span style=\" font-size:9pt; color:#00aaff;\">input_scale_meters</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">Save it in the </span><span style=\" font-size:9pt; color:#00aaff;\">Import Directory</span><span style=\" font-size:9pt; color:#e7e7e7;\"> as </span><span style=\" font-size:9pt; color:#00aaff;\">TestBridge</span><span style=\" font-size:9pt; color:#e7e7e7;\">_</span><span style=\" font-size:9pt; color:#00aaff;\">crosssection.png</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">2.0) Use </span><span style=\" font-size:9pt; font-weight:600; color:#"
-                        "e7e7e7;\">Update Bridge Dat</span><span style=\" font-size:9pt; color:#e7e7e7;\">a and select the import file, if available and select appropriate coordinate system and datum.</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">Else, keep project in </span><span style=\" font-size:9pt; color:#00aaff;\">WGS84</span><span style=\" font-size:9pt; color:#e7e7e7;\"> and </span><span style=\" font-size:9pt; color:#00aaff;\">agl</span><span style=\" font-size:9pt; color:#e7e7e7;\"> = Above Ground Level</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">2.1) Use </span><span style=\" font-size:9pt; fon"
-                        "t-weight:600; color:#e7e7e7;\">Update Cross section</span><span style=\" font-size:9pt; color:#e7e7e7;\"> to extract the cross section appropriately</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#e7e7e7;\">2.2) </span><span style=\" font-size:9pt; font-weight:600; color:#e7e7e7;\">Confirm the project</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:9pt;\"><br /></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p></body></html>", None))
+"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt;\">\n"
+"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; font-size:10pt;\"><span style=\" font-weight:600; text-decoration: underline; color:#e7e7e7;\">Workflow</span></p>\n"
+"<p align=\"center\" style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-size:10pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">1) Prepare available data:</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">1.1) Select a bridge name, e."
+                        "g. </span><span style=\" color:#0af;\">TestBridge</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">1.2) Prepare known trajectory points in 3D (e.g. using MeshLab, if model available) in TestBridge.txt file in the </span><span style=\" color:#0af;\">Import Directory</span><span style=\" color:#e7e7e7;\"> in the format:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">Trajectory:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100109.101562 195889.515625 13.793574]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100132.921875 195906.546875 14.485563]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100157.093750 195"
+                        "923.562500 14.700541]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100182.257812 195941.484375 14.491943]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100208.867188 195960.093750 13.645084]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">Pillars:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100133.992188 195914.203125 6.784123]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100134.429688 195900.734375 6.921566]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100183.953125 195949.078125 7.142460]</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:8pt;\"><span style=\" color:#e7e7e7;\">[100184.062500 19593"
+                        "6.015625 7.130339]</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">1.3) Prepare a technical drawing of a crosssection and give the inside a blue fill. </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">Mark the longest distance in green to extract the scale = </span><span style=\" color:#0af;\">input_scale_meters</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">Save it in the </span><span style=\" color:#0af;\">Import Directory</span><span style=\" color:#e7e7e7;\"> as </span><span style=\" color:#0af;\">TestBridge</span><span style=\" color:#e7e7e7;\">_</span><span style=\" color:#0af;\">crosssection.png</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margi"
+                        "n-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">2.0) Use </span><span style=\" font-weight:600; color:#e7e7e7;\">Update Bridge Dat</span><span style=\" color:#e7e7e7;\">a and select the import file, if available and select appropriate coordinate system and datum.</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">Else, keep project in </span><span style=\" color:#0af;\">WGS84</span><span style=\" color:#e7e7e7;\"> and </span><span style=\" color:#0af;\">agl</span><span style=\" color:#e7e7e7;\"> = Above Ground Level</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">2.1) Use </span><span style=\" font-weight:600; color:#e7e7e7;\">Update Cross section</span><span style=\" color:#e7e7e7;\"> to extract the cross section appropriately</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-t"
+                        "op:0px; margin-bottom:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; font-size:9pt;\"><span style=\" color:#e7e7e7;\">2.2) </span><span style=\" font-weight:600; color:#e7e7e7;\">Confirm the project</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-size:9pt;\"><br /></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px;\"><br /></p></body></html>", None))
 #if QT_CONFIG(tooltip)
         self.btn_tab0_LoadBridgeData.setToolTip(QCoreApplication.translate("MainWindow", u"Update project data based on import files, e.g. 3D trajectory data in various formats and crosssection .png", None))
 #endif // QT_CONFIG(tooltip)
@@ -1136,7 +885,6 @@ class Ui_MainWindow(object):
         self.btn_tab0_ConfirmProjectData.setToolTip(QCoreApplication.translate("MainWindow", u"Confirm project data and prepare for 3D modeling", None))
 #endif // QT_CONFIG(tooltip)
         self.btn_tab0_ConfirmProjectData.setText(QCoreApplication.translate("MainWindow", u"Confirm Project Data", None))
-        self.tab1Label.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: white; font-weight: bold; text-align: center;", None))
         self.tab1Label.setText(QCoreApplication.translate("MainWindow", u"Bridge Gemeometry ", None))
         self.label_2.setText("")
         self.trajectoryGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Trajectory", None))
@@ -1152,7 +900,6 @@ class Ui_MainWindow(object):
         self.btnRedo_trajectory.setToolTip(QCoreApplication.translate("MainWindow", u"Redo last undone trajectory point.", None))
 #endif // QT_CONFIG(tooltip)
         self.btnRedo_trajectory.setText("")
-        self.pillarsGroupBox.setStyleSheet(QCoreApplication.translate("MainWindow", u"QGroupBox { color: white; font-weight: bold; }", None))
         self.pillarsGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Pillars", None))
 #if QT_CONFIG(tooltip)
         self.btn_tab1_mark_pillars.setToolTip(QCoreApplication.translate("MainWindow", u"Toggle pillar marking mode. When active, click on the map to add pillar pairs.", None))
@@ -1166,7 +913,6 @@ class Ui_MainWindow(object):
         self.btnRedo_Pillar.setToolTip(QCoreApplication.translate("MainWindow", u"Redo last undone pillar.", None))
 #endif // QT_CONFIG(tooltip)
         self.btnRedo_Pillar.setText("")
-        self.safetyZonesGroupBox.setStyleSheet(QCoreApplication.translate("MainWindow", u"QGroupBox { color: white; font-weight: bold; }", None))
         self.safetyZonesGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Safety Zones", None))
 #if QT_CONFIG(tooltip)
         self.btn_tab1_SafetyZones.setToolTip(QCoreApplication.translate("MainWindow", u"Toggle safety zone drawing mode. When active, click on the map to add corner points (minimum 3 points required).", None))
@@ -1188,7 +934,6 @@ class Ui_MainWindow(object):
         self.btnAdd_Safety.setToolTip(QCoreApplication.translate("MainWindow", u"Completes current zone and start a new safety zone.", None))
 #endif // QT_CONFIG(tooltip)
         self.btnAdd_Safety.setText("")
-        self.pillarsGroupBox_2.setStyleSheet(QCoreApplication.translate("MainWindow", u"QGroupBox { color: white; font-weight: bold; }", None))
         self.pillarsGroupBox_2.setTitle(QCoreApplication.translate("MainWindow", u"Approximate ellipsoidal height", None))
 #if QT_CONFIG(tooltip)
         self.btn_tab1_select_startingpoint.setToolTip(QCoreApplication.translate("MainWindow", u"Toggle pillar marking mode. When active, click on the map to add pillar pairs.", None))
@@ -1205,14 +950,13 @@ class Ui_MainWindow(object):
         self.textEdit_2.setHtml(QCoreApplication.translate("MainWindow", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
 "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
 "p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:7pt; color:#ffffff;\">This feature is implemented for Belgium only.<br />/tools/EllipsoidalHeightFrommaps/ellipsoidalHeight.py</span></p>\n"
-"<p align=\"center\" style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:7pt; color:#ffffff;\"><br /></p></body></html>", None))
+"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt;\">\n"
+"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px;\"><span style=\" font-size:7pt; color:#fff;\">This feature is implemented for Belgium only.<br />/tools/EllipsoidalHeightFrommaps/ellipsoidalHeight.py</span></p>\n"
+"<p align=\"center\" style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; font-size:7pt; color:#fff;\"><br /></p></body></html>", None))
 #if QT_CONFIG(tooltip)
         self.btn_tab1_build_model.setToolTip(QCoreApplication.translate("MainWindow", u"Construct a 3D representation based on cross section and 3D trajectory data (taking trajectory_heights into account for AboveGroundLevel projects)", None))
 #endif // QT_CONFIG(tooltip)
         self.btn_tab1_build_model.setText(QCoreApplication.translate("MainWindow", u"Build Model", None))
-        self.tab2Label.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: white; font-weight: bold; text-align: center;", None))
         self.tab2Label.setText(QCoreApplication.translate("MainWindow", u"Flightroute Generation", None))
         self.label_3.setText("")
 #if QT_CONFIG(tooltip)
@@ -1235,17 +979,10 @@ class Ui_MainWindow(object):
         self.btn_tab2_Dock_updateInspectionRoute.setToolTip(QCoreApplication.translate("MainWindow", u"Generate under-deck inspection routes", None))
 #endif // QT_CONFIG(tooltip)
         self.btn_tab2_Dock_updateInspectionRoute.setText(QCoreApplication.translate("MainWindow", u"Update Inspection  Route", None))
-#if QT_CONFIG(tooltip)
-        self.WaypointsSlider.setToolTip("")
-#endif // QT_CONFIG(tooltip)
 #if QT_CONFIG(tooltip)
         self.label_4.setToolTip(QCoreApplication.translate("MainWindow", u"Simplify flight route by removing waypoints that don't change direction significantly. Use lower threshold to follow curvatures.", None))
 #endif // QT_CONFIG(tooltip)
         self.label_4.setText(QCoreApplication.translate("MainWindow", u"Simplify by angle threshold", None))
-#if QT_CONFIG(tooltip)
-        self.WaypointsQLineEdit.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-        self.WaypointsQLineEdit.setText(QCoreApplication.translate("MainWindow", u"0", None))
 #if QT_CONFIG(tooltip)
         self.btn_tab2_ExportOverview.setToolTip(QCoreApplication.translate("MainWindow", u"Export overview flight routes as KML files zipped as DJI-compatible KMZ files", None))
 #endif // QT_CONFIG(tooltip)
@@ -1258,183 +995,13 @@ class Ui_MainWindow(object):
         self.btn_tab2_SafeProject.setToolTip(QCoreApplication.translate("MainWindow", u"Exports the whole project to the project directory.", None))
 #endif // QT_CONFIG(tooltip)
         self.btn_tab2_SafeProject.setText(QCoreApplication.translate("MainWindow", u"Save Project", None))
-        self.tab0_textEdit1_Photo.setHtml(QCoreApplication.translate("MainWindow", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p align=\"center\" style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Project Information</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">bridge_name = </span><span style=\" font-size:11pt; color:#00aaff;\">TestBridge </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"># Input data should have {</span><span style=\" font-size:11p"
-                        "t; color:#e7e7e7;\">bridge_name</span><span style=\" font-size:11pt; color:#6a9955;\">}</span><span style=\" font-size:11pt; color:#e7e7e7;\"> </span><span style=\" font-size:11pt; color:#6a9955;\">and be in</span><span style=\" font-size:11pt; color:#e7e7e7;\"> import_dir</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">import_dir = </span><span style=\" font-size:11pt; color:#00aaff;\">C:\\Code\\_Orbitv1.2.2\\01_ImportFolder</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">project_dir_base = </span><span style=\" font-size:11pt; color:#00aaff;\">C:\\Code\\_Orbitv1.2.2\\02_FlightRoutes </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"># base for the project output</span></p>\n"
-"<p style=\""
-                        " margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">conda_environment = Orbit</span><span style=\" font-size:11pt; color:#00aaff;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"># conda info --envs</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Trajectory </span><span style=\" font-size:11pt; text-decoration: underline; color:#e7e7e7;\">(If no import data available)</span><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">: </span></p>\n"
-"<p style=\" margin-top:12px;"
-                        " margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">trajectory_heights = </span><span style=\" font-size:11pt; color:#00aaff;\">[6.4, 6.4] </span><span style=\" font-size:11pt; color:#6a9955;\"># Approx. height of bridge trajectory above starting point, quadratic approx. </span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Aptos,sans-serif'; font-size:11pt; color:#e7e7e7;\">ground_elevation</span><span style=\" font-size:11pt; color:#e7e7e7;\"> = </span><span style=\" font-size:11pt; color:#00aaff;\">0 </span><span style=\" font-size:11pt; color:#6a9955;\"># Purely cosmetic. Defines pillar base altitude. </span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:12px; "
-                        "margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Coordinate system:</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">coordinate_system = </span><span style=\" font-size:11pt; color:#00aaff;\">WGS84 </span><span style=\" font-size:11pt; color:#6a9955;\"># </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\">Lambert2008, Lambert72, or any EPSG code </span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#e7e7e7;\">heightStartingPoint_Ellipsoid</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#"
-                        "9cdcfe;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#e7e7e7;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#00aaff;\">0</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#e7e7e7;\">heightStartingPoint_Reference</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#e7e7e7;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\"> </span><span style=\" font-family:'Conso"
-                        "las,Courier New,monospace'; font-size:11pt; color:#00aaff;\">0</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:6pt; color:#ce9178;\"> </span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Cross-section:</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span styl"
-                        "e=\" font-size:11pt; color:#e7e7e7;\">input_scale_meters = </span><span style=\" font-size:11pt; color:#00aaff;\">17.279 </span><span style=\" font-size:11pt; color:#6a9955;\"># Mark one distance in green. bridge_width is the largest distance across.</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#e7e7e7;\">epsilonInput =</span><span style=\" font-size:11pt; color:#00aaff;\"> 0.003 </span><span style=\" font-size:11pt; color:#6a9955;\"># Smaller value is tighter fit</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:6pt; color:#6a9955;\"> </span><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Imported data:</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-i"
-                        "ndent:0px;\"><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">trajectory_points_count = 0</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">pillars_count = 0</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">trajectory_length = 0</span></p>\n"
-"<p style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Segoe UI'; font-size:11pt; color:#e7e7e7;\">average_pillar_height = 0</span></p></body></html>", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_0), QCoreApplication.translate("MainWindow", u"1) Project Information", None))
-        self.tab1_QWebEngineView.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: white; font-size: 14px; background-color: rgba(0,0,0,0.3); padding: 20px;", None))
-        self.tab1_QWebEngineView.setText(QCoreApplication.translate("MainWindow", u"Map Widget Area\n"
-"(QWebEngineView would be inserted here via layout)", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_1), QCoreApplication.translate("MainWindow", u"2) Statellite map ", None))
-        self.Placeholder2.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: white; font-size: 14px; background-color: rgba(0,0,0,0.3); padding: 20px;", None))
-        self.Placeholder2.setText(QCoreApplication.translate("MainWindow", u"3D Visualization Area\n"
-"(This would contain your visualization widget)", None))
         self.dockWidget_FR.setWindowTitle(QCoreApplication.translate("MainWindow", u"Flight Route Settings", None))
-        self.tab3_textEdit.setHtml(QCoreApplication.translate("MainWindow", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:'MS Shell Dlg 2'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Overview Flight: </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">order</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><sp"
-                        "an style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> [</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;101&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;r101&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;102&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;r102&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'Consolas,Courier New,m"
-                        "onospace'; font-size:11pt; color:#ce9178;\">&quot;103&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;r103&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-size:11pt; color:#9cdcfe;\">transition_mode</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;201&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;r201&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'"
-                        "Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;202&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;r202&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">,</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;203&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;r203&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">] </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># 1=right side, r=reverse. useing offsets as in </span><span style=\" font-family:"
-                        "'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">standard_flight_routes (</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">below)</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#9cdcfe;\">transition_mode</span><span style=\" font-size:11pt; color:#e7e7e7;\"> = </span><span style=\" font-size:11pt; color:#ce9178;\">2</span><span style=\" font-size:11pt; color:#e7e7e7;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># 0 = separate right and left side, 1=pass middle, 2=after last segment</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">transition_vertical_offset = </span><span style=\" fon"
-                        "t-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">15 </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Or underneath e.g. -6 </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">transition_horizontal_offset = </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">15</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Safety Zones:</span></p>\n"
-"<p style=\" margin-top:0px; margin-b"
-                        "ottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">safety_zones_clearance</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[[0,25],[0,25],[0,25]]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">#min, max local. default 0,35 m</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"><br /></span><span style=\" font-family:'Consolas,Courier Ne"
-                        "w,monospace'; font-size:11pt; color:#9cdcfe;\">safety_zones_clearance_adjust</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[[25],[25],[25]]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># adjust points inside zones. 0 = delete points, -1 find closest exit</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -"
-                        "qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Underdeck Flights: </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">num_points</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[3, 7, 3]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt"
-                        "; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Base points per section </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">horizontal_offsets_underdeck</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[8, 8, 8]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># H_Offest of base points </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0"
-                        "px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">height_offsets_underdeck</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[[5, 5, 5], [5, 5, 5], [5, 5, 5]]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Vertical offset below trajectory (consider slab) using quadratic approx per base point.</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent"
-                        ":0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">general_height_offset</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> 1</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">thresholds_zones</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-"
-                        "family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[(10, 10), (8, 8), (10, 10)]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Threshold distance </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">custom_zone_angles = </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\"># </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">[2.16, 2.20, 2.24]</span><span style=\""
-                        " font-family:'Consolas,Courier New,monospace'; font-size:8pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Adjust angle</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">connection_height </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> 25</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#b5cea8;\">	</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># vertical flight height for connections</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0p"
-                        "x;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">num_passes</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">2		</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># num passes underdeck flighs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">num_passes_middle</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font"
-                        "-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">4</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#6a9955;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Export Modus:</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">heightMode = </span><span style=\""
-                        " font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">EGM96 </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">#</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">relativeToStartPoint</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"> or EGM96</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">heightStartingPoint_Ellipsoid = </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">0 </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Typically </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">50.2 m </span><span style="
-                        "\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">in Belgium.</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">Place drone on ground and read EXIF from image / RTK settings</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">heightStartingPoint_Reference = </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">0 </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Typically </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">8.0 m</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt;"
-                        " color:#4eea00;\">.</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\">Height in geolocated point cloud </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># Z waypoint= bridge trajectory (e.g. </span><span style=\" font-size:11pt; color:#e7e7e7;\">trajectory_heights)</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"> + offsets + </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">heightStartingPoint_Ellipsoid - heightStartingPoint_Reference</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-ind"
-                        "ent:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; font-weight:600; text-decoration: underline; color:#e7e7e7;\">Additional Features:</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">safety_check_photo </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">= </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">1</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">sa"
-                        "fety_check_underdeck </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">= </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[[0],[0],[0]]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># 1 = execute safety check. </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">safety_check_underdeck_axial </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">= </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">[[0],[0],[0]]</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:1"
-                        "1pt; color:#d4d4d4;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># 1 = execute safety check.</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#9cdcfe;\">n_girders</span><span style=\" font-size:11pt; color:#e7e7e7;\"> = </span><span style=\" font-size:11pt; color:#ce9178;\">3</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#9cdcfe;\">underdeck_split</span><span style=\" font-size:11pt; color:#e7e7e7;\"> = </span><span style=\" font-size:11pt; color:#ce9178;\">1</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:11pt; color:#9cdcfe;\">underdeck_axial</span><span style=\" font-size:11pt; color:#e7e7e7;"
-                        "\"> = </span><span style=\" font-size:11pt; color:#ce9178;\">0</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">droneEnumValue = </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">77 </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># M3E = 77 </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">payloadEnumValue = </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">66 </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># M3E = 66 </span></p>\n"
-"<p style=\" margi"
-                        "n-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; font-size:11pt; color:#9cdcfe;\">globalWaypointTurnMode</span><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; font-size:11pt; color:#d8dee9;\"> </span><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; font-size:11pt; color:#9cdcfe;\">=</span><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; font-size:11pt; color:#d8dee9;\"> </span><span style=\" font-family:'Segoe WPC,Segoe UI,sans-serif'; font-size:11pt; color:#ce9178;\">toPointAndStopWithDiscontinuityCurvature </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"># coordinateTurn, toPointAndStopWithContinuityCurvature, toPointAndPassWithContinuityCurvature</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-fa"
-                        "mily:'Consolas,Courier New,monospace'; font-size:11pt; color:#4eea00;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">standard_flight_routes</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> {</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;101&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,"
-                        "Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;vertical_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 12, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;distance_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 12},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;102&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;vertical_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 8, </span><span st"
-                        "yle=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;distance_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 8},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;103&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;vertical_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: -2, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;distance_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cc"
-                        "cccc;\">: 7},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;201&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;vertical_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 12, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;distance_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 12},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monosp"
-                        "ace'; font-size:11pt; color:#ce9178;\">&quot;202&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;vertical_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 8, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;distance_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 8},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;203&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Couri"
-                        "er New,monospace'; font-size:11pt; color:#ce9178;\">&quot;vertical_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: -2, </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;distance_offset&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: 7}}</span></p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"><br /></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#9cdcfe;\">flight_speed_map</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> </span><span style"
-                        "=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#d4d4d4;\">=</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\"> {</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;101&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;5&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span><span style=\" font-family:'Consolas,Courie"
-                        "r New,monospace'; font-size:11pt; color:#ce9178;\">&quot;102&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;4&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;201&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace';"
-                        " font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;5&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;202&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;4&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\""
-                        ">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;103&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;2&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;203&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span s"
-                        "tyle=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;2&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;104&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-fam"
-                        "ily:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;3&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;105&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;2&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courie"
-                        "r New,monospace'; font-size:11pt; color:#ce9178;\">&quot;204&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;3&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;205&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:1"
-                        "1pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;2&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;transition&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;5&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#c"
-                        "ccccc;\">},<br /></span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;underdeck_span1&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;0.8&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;underdeck_span2&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:"
-                        "11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;0.85&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;underdeck_span3&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:"
-                        "11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;0.8&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;connection&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;2.5&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; col"
-                        "or:#cccccc;\">},	 </span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;axial_span1&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;1.0&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:1"
-                        "1pt; color:#ce9178;\">&quot;axial_span2&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;1.0&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">},</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;axial_span3&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: {</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:"
-                        "11pt; color:#ce9178;\">&quot;speed&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">: </span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#ce9178;\">&quot;1.0&quot;</span><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">}</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:'Consolas,Courier New,monospace'; font-size:11pt; color:#cccccc;\">}}</span></p></body></html>", None))
         self.labelPF.setText(QCoreApplication.translate("MainWindow", u"Transformation", None))
         self.label1.setText(QCoreApplication.translate("MainWindow", u"X offset:", None))
-#if QT_CONFIG(tooltip)
-        self.slider_offset_X.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-#if QT_CONFIG(tooltip)
-        self.text_slider_offset_X.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-        self.text_slider_offset_X.setText(QCoreApplication.translate("MainWindow", u"0", None))
         self.label2.setText(QCoreApplication.translate("MainWindow", u"Y offset:", None))
-#if QT_CONFIG(tooltip)
-        self.slider_offset_Y.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-#if QT_CONFIG(tooltip)
-        self.text_slider_offset_Y.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-        self.text_slider_offset_Y.setText(QCoreApplication.translate("MainWindow", u"0", None))
         self.label2_2.setText(QCoreApplication.translate("MainWindow", u"Z offset:", None))
-#if QT_CONFIG(tooltip)
-        self.slider_offset_Z.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-#if QT_CONFIG(tooltip)
-        self.text_slider_offset_Z.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-        self.text_slider_offset_Z.setText(QCoreApplication.translate("MainWindow", u"0", None))
         self.btnToggleFR.setText("")
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), QCoreApplication.translate("MainWindow", u"3) Flightroute Generation", None))
     # retranslateUi
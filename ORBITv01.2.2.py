@@ -47,7 +47,6 @@ try:
 except Exception:
     pass
 from lxml import etree as ET
-from pyproj import Transformer
 from tqdm import tqdm
 
 # ——— Qt (PySide6) ————————————————————————————————————————————————
@@ -95,6 +94,7 @@ from PySide6.QtWidgets import (
 
 # ——— First-party (orbit) ————————————————————————————————————————————
 from orbit.resources import resources_rc 
+from orbit.resources.templates import get_resource_path, get_stylesheet
 from orbit.io.context import CoordinateSystemRegistry, ProjectContext, VerticalRef
 from orbit.io.crs import CoordinateSystem
 from orbit.io.data_parser import parse_text_boxes, set_debug_print
@@ -158,7 +158,7 @@ class OrbitMainApp(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.ui = QUiLoader().load(QFile(str(Path(__file__).parent / "ORBIT_UI4.ui")))
+        self.ui = None  # populated by load_ui() below
         
         # Initialize attributes
         self.current_bridge = None
@@ -171,6 +171,9 @@ class OrbitMainApp(QMainWindow):
         # Initialize drawing data
         self.current_trajectory = []
         self.current_pillars = []
+        self._map_trajectory_sent = None  # last [lat, lon] list pushed to the web map
+        self._map_update_pending = False
+        self._map_js_batch = None  # scripts queued by _run_map_js() during a map refresh
         
                 # Initialize globally accessible extracted data
         self.trajectory_list = []  # [[x,y,z], [x,y,z], ...] - globally accessible
@@ -278,6 +281,11 @@ class OrbitMainApp(QMainWindow):
             
         # Get references to key widgets
         self.left_panel_stacked = self.ui.findChild(QWidget, "leftPanelStackedWidget")
+
+        # One stylesheet for the whole window, kept in orbit/resources/qss
+        # (compiled into resources_rc) rather than inline in the .ui file.
+        # Panel- and dock-specific rules are scoped by objectName inside it.
+        self.ui.setStyleSheet(get_stylesheet("main_window"))
         self.tab_widget = self.ui.findChild(QWidget, "tabWidget")
         self.project_text_edit = self.ui.findChild(QWidget, "tab0_textEdit1_Photo")
         # IMPORTANT: flight-route settings are authored in Tab-3 (tab3_textEdit).
@@ -321,29 +329,15 @@ class OrbitMainApp(QMainWindow):
             self.web_view = QWebEngineView(self.ui)
             self.web_view.setMinimumSize(800, 600)  # Ensure visible size
             
-            # Set up debug page to capture JS console output
-            self.debug_page = DebugWebEnginePage()
-            self.web_view.setPage(self.debug_page)
-            
-            # Allow file:// URLs to access remote resources (for Leaflet CDN)
-            setting_name = (
-                "LocalContentCanAccessRemoteUrls"
-                if hasattr(QWebEngineSettings, "LocalContentCanAccessRemoteUrls")
-                else "LocalContentCanAccessRemoteUrl"
-            )
-            self.debug_page.settings().setAttribute(getattr(QWebEngineSettings, setting_name), True)
-            
             idx = parent_layout.indexOf(placeholder)
             parent_layout.removeWidget(placeholder)
             placeholder.deleteLater()
             parent_layout.insertWidget(idx, self.web_view)
 
-            # Optional Web channel bridge (for future interactive features)
-            self.map_bridge = MapBridge()
-            self.map_bridge.click_handler = self.handle_map_click  # Connect our handler
-            channel = QWebChannel()
-            channel.registerObject('bridge', self.map_bridge)
-            self.web_view.page().setWebChannel(channel)
+            # The page (DebugWebEnginePage) is created in _setup_map_widget() and
+            # the WebChannel bridge once the map has loaded
+            # (_on_map_load_finished), so no throwaway page is built here.
+            self.map_bridge = None
 
             # Create and load simple working HTML content
             self._setup_map_widget()
@@ -389,7 +383,7 @@ class OrbitMainApp(QMainWindow):
         """Setup the map widget and load the HTML map."""
         debug_print("[DEBUG] Setting up map widget...")
 
-        # Prefer the advanced dynamic map if it exists; otherwise generate simple map
+        # Prefer the advanced dynamic map if it exists; otherwise use the simple map
         try:
             dynamic_path = (Path(__file__).parent / "orbit" / "tools" / "HTML Visualization MOW data" / "bruggen_interactive_map_dynamic.html").resolve()
         except Exception:
@@ -400,9 +394,9 @@ class OrbitMainApp(QMainWindow):
             map_path = str(dynamic_path)
             debug_print(f"[DEBUG] Using dynamic map HTML at: {map_path}")
         else:
-            # Create simple map HTML file
-            map_path = self._create_simple_map_html()
-            debug_print(f"[DEBUG] Created simple map HTML at: {map_path}")
+            # Static Leaflet page shipped with the resources
+            map_path = str((get_resource_path() / "flight_map.html").absolute())
+            debug_print(f"[DEBUG] Using simple map HTML at: {map_path}")
 
         # Setup QWebEngineView
         self.debug_page = DebugWebEnginePage()
@@ -422,123 +416,6 @@ class OrbitMainApp(QMainWindow):
 
         debug_print("[DEBUG] Map widget setup complete")
     
-    def _create_simple_map_html(self):
-        """Create a simple HTML file with working Leaflet map."""
-        html_content = '''<!DOCTYPE html>
-<html>
-<head>
-    <title>ORBIT Flight Planning Map</title>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
-    <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
-    <style>
-        html, body { height: 100%; margin: 0; padding: 0; }
-        #map { height: 100%; width: 100%; }
-        .search-container {
-            position: absolute; top: 10px; left: 70px; z-index: 1000;
-            background: white; padding: 10px; border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.3);
-        }
-    </style>
-</head>
-<body>
-    <div class="search-container">
-        <input type="text" id="searchInput" placeholder="Enter location" style="width: 200px;">
-        <button onclick="searchLocationAndZoom()" style="margin-left: 5px;">Search</button>
-    </div>
-    <div id="map"></div>
-    <script>
-        console.log('Initializing ORBIT map...');
-        
-        // Create map centered on Belgium (good default for bridge inspection)
-        var map = L.map('map').setView([50.8503, 4.3517], 10);
-        console.log('Map created');
-        // Ensure global alias so external scripts can reference window.map
-        try { window.map = map; } catch (e) {}
-        // Add street layer
-        var osmLayer = L.tileLayer('https://{s}.google.com/vt/lyrs=m&x={x}&y={y}&z={z}', {
-            maxZoom: 30,
-            subdomains: ['mt0', 'mt1', 'mt2', 'mt3'],
-            attribution: 'Map data &copy; Google'
-        });
-        
-        // Add satellite layer option
-        var satelliteLayer = L.tileLayer('https://{s}.google.com/vt/lyrs=s&x={x}&y={y}&z={z}', {
-            maxZoom: 30,
-            subdomains: ['mt0', 'mt1', 'mt2', 'mt3'],
-            attribution: 'Imagery &copy; Google'
-        });
-        // Add satellite layer as default
-        osmLayer.addTo(map);
-
-        // Layer control
-        L.control.layers({
-            "Street": osmLayer,
-            "Satellite": satelliteLayer
-        }).addTo(map);
-        
-        console.log('Map layers configured');
-        
-        // Search functionality
-        function searchLocationAndZoom() {
-            var address = document.getElementById('searchInput').value;
-            if (!address) return;
-            
-            // Using Nominatim (OpenStreetMap) geocoding service
-            var url = 'https://nominatim.openstreetmap.org/search?format=json&q=' + encodeURIComponent(address);
-            fetch(url)
-                .then(response => response.json())
-                .then(data => {
-                    if (data && data.length > 0) {
-                        var result = data[0];
-                        var lat = parseFloat(result.lat);
-                        var lon = parseFloat(result.lon);
-                        map.setView([lat, lon], 15);
-                        L.marker([lat, lon]).addTo(map)
-                            .bindPopup(address)
-                            .openPopup();
-                        console.log('Searched location: ' + address + ' -> ' + lat + ', ' + lon);
-                    } else {
-                        alert('Location not found: ' + address);
-                    }
-                })
-                .catch(error => {
-                    console.error('Search error:', error);
-                    alert('Search failed');
-                });
-        }
-        
-        // Allow search on Enter key
-        document.getElementById('searchInput').addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                searchLocationAndZoom();
-            }
-        });
-        
-        // WebChannel will be initialized from Qt side after page load
-        window.initWebChannelFromQt = function() {
-            if (typeof qt !== 'undefined' && qt.webChannelTransport) {
-                console.log('Initializing WebChannel from Qt...');
-                new QWebChannel(qt.webChannelTransport, function(channel) {
-                    window.bridge = channel.objects.bridge;
-                    console.log('SUCCESS: WebChannel bridge connected and ready!');
-                });
-            } else {
-                console.log('ERROR: Qt WebChannel transport not available');
-            }
-        };
-        
-        console.log('ORBIT map initialization complete');
-    </script>
-</body>
-</html>'''
-    
-        # Write to file
-        map_file = Path(__file__).parent / "flight_map.html"
-        map_file.write_text(html_content, encoding='utf-8')
-        debug_print(f"[DEBUG] Created flight map HTML at: {map_file}")
-        return str(map_file.absolute())
-
     def _on_map_load_finished(self, ok: bool):
         """Load bridge data visualization after map loads."""
         if not ok:
@@ -578,6 +455,7 @@ class OrbitMainApp(QMainWindow):
             console.log('Map layers created');
         '''
         self.debug_page.runJavaScript(js_setup_layers)
+        self._map_trajectory_sent = None
         
 
     def _prepare_pillars_for_map(self, pillars):
@@ -588,36 +466,31 @@ class OrbitMainApp(QMainWindow):
         inv = getattr(self, "_last_inverse_transform", None)
         coord_sys = str(getattr(self, "_last_coordinate_system", "WGS84_Fallback"))
         use_inv = callable(inv) and coord_sys.startswith("LocalMetric_")
-        out = []
 
+        ids, rows, is_local = [], [], []
         for i, p in enumerate(pillars or []):
-            pid = p.get("id", f"P{i+1}")
             if "lat" in p and "lon" in p:
-                lat, lon = p["lat"], p["lon"]
+                row, local = (p["lat"], p["lon"], 0.0), False
             elif "x" in p and "y" in p:
                 if not use_inv:
                     # can't safely convert without inverse
                     continue
-                x, y, z = p.get("x", np.nan), p.get("y", np.nan), p.get("z", 0.0)
-                try:
-                    lon, lat, _ = inv(float(x), float(y), float(z))
-                except Exception:
-                    continue
+                row, local = (p.get("x", np.nan), p.get("y", np.nan), p.get("z", 0.0)), True
             else:
                 continue
-
             try:
-                lat = float(lat); lon = float(lon)
+                rows.append([float(v) for v in row])
             except Exception:
                 continue
-            if not (np.isfinite(lat) and np.isfinite(lon)):
-                continue
-
-            lat = float(np.clip(lat, -90.0, 90.0))
-            lon = float(((lon + 180.0) % 360.0) - 180.0)
-            out.append({"id": pid, "lat": lat, "lon": lon})
+            ids.append(p.get("id", f"P{i+1}"))
+            is_local.append(local)
 
-        return out
+        if not rows:
+            return []
+        arr = np.asarray(rows, dtype=np.float64)
+        lat, lon, valid = self._map_rows_to_lat_lon(arr, np.asarray(is_local, dtype=bool), inv)
+        kept_ids = [pid for pid, ok in zip(ids, valid) if ok]
+        return [{"id": pid, "lat": la, "lon": lo} for pid, la, lo in zip(kept_ids, lat.tolist(), lon.tolist())]
 
     def _prepare_points_for_map(self, pts, *, pts_are_local_metric=False):
         """
@@ -626,56 +499,84 @@ class OrbitMainApp(QMainWindow):
         - If pts_are_local_metric=True, converts using self._last_inverse_transform (Local->WGS84).
         - Drops any invalid points (NaN/inf).
         """
-        out = []
+        if pts is None or len(pts) == 0:
+            return []
         inv = getattr(self, "_last_inverse_transform", None)
         coord_sys = str(getattr(self, "_last_coordinate_system", "WGS84_Fallback"))
         use_inv = pts_are_local_metric and callable(inv) and coord_sys.startswith("LocalMetric_")
 
-        for p in (pts or []):
-            # accept tuple/list or dict
-            if isinstance(p, dict):
-                # prefer explicit lat/lon; otherwise x/y
-                if "lat" in p and "lon" in p:
-                    a, b, z = p["lat"], p["lon"], p.get("z", 0.0)
-                    is_local = False
+        # Fast path: a homogeneous list of [a, b] / [a, b, z] rows
+        try:
+            arr = np.asarray(pts, dtype=np.float64)
+        except (TypeError, ValueError):
+            arr = None
+        if arr is not None and arr.ndim == 2 and arr.shape[1] >= 2:
+            if arr.shape[1] == 2:
+                arr = np.column_stack([arr, np.zeros(len(arr))])
+            is_local = np.full(len(arr), bool(pts_are_local_metric))
+        else:
+            # Mixed rows or dicts: normalise row by row; unusable rows become NaN
+            rows, flags = [], []
+            for p in pts:
+                if isinstance(p, dict):
+                    # prefer explicit lat/lon; otherwise x/y
+                    if "lat" in p and "lon" in p:
+                        row, local = (p["lat"], p["lon"], p.get("z", 0.0)), False
+                    else:
+                        row, local = (p.get("x"), p.get("y"), p.get("z", 0.0)), True
                 else:
-                    a, b, z = p.get("x"), p.get("y"), p.get("z", 0.0)
-                    is_local = True
-            else:
-                # sequence: [a, b, (z)]
-                a = p[0] if len(p) > 0 else np.nan
-                b = p[1] if len(p) > 1 else np.nan
-                z = p[2] if len(p) > 2 else 0.0
-                is_local = pts_are_local_metric
-
-            try:
-                a = float(a); b = float(b); z = float(z)
-            except Exception:
-                continue
+                    # sequence: [a, b, (z)]
+                    row = (
+                        p[0] if len(p) > 0 else np.nan,
+                        p[1] if len(p) > 1 else np.nan,
+                        p[2] if len(p) > 2 else 0.0,
+                    )
+                    local = pts_are_local_metric
+                try:
+                    rows.append([float(v) for v in row])
+                except Exception:
+                    rows.append([np.nan, np.nan, 0.0])
+                flags.append(local)
+            arr = np.asarray(rows, dtype=np.float64).reshape(-1, 3)
+            is_local = np.asarray(flags, dtype=bool)
 
-            if not (np.isfinite(a) and np.isfinite(b)):
-                continue
+        lat, lon, _ = self._map_rows_to_lat_lon(arr, is_local | use_inv, inv)
+        return np.column_stack([lat, lon]).tolist()
 
-            if use_inv or is_local:
-                # local metric -> WGS84 via inverse (expects x,y,z -> returns lon,lat,z)
-                if callable(inv):
+    def _map_rows_to_lat_lon(self, rows: np.ndarray, is_local: np.ndarray, inv):
+        """
+        Convert Nx3 map rows to clean WGS84 arrays (lat, lon, valid_mask).
+        Rows flagged in is_local are (x, y, z) local metric and go through the inverse
+        transform; the others are already (lat, lon, z). Non-finite rows are dropped.
+        """
+        lat = rows[:, 0].copy()
+        lon = rows[:, 1].copy()
+        valid = np.isfinite(lat) & np.isfinite(lon)
+
+        local = valid & is_local
+        if local.any():
+            if not callable(inv):
+                # No inverse available; cannot convert safely
+                valid &= ~local
+            elif (
+                str(getattr(self, "_last_coordinate_system", "")).startswith("LocalMetric_")
+                and getattr(self, "_local_metric_center_lat", None) is not None
+                and getattr(self, "_local_metric_center_lon", None) is not None
+            ):
+                lon[local], lat[local], _ = self._active_local_metric_arrays_to_wgs84(
+                    rows[local, 0], rows[local, 1], rows[local, 2]
+                )
+            else:
+                for k in np.flatnonzero(local):
                     try:
-                        lon, lat, _ = inv(a, b, z)
+                        lon[k], lat[k], _ = inv(rows[k, 0], rows[k, 1], rows[k, 2])
                     except Exception:
-                        continue
-                else:
-                    # No inverse available; cannot convert safely
-                    continue
-            else:
-                # already WGS84 lat=a, lon=b
-                lat, lon = a, b
+                        valid[k] = False
 
-            if np.isfinite(lat) and np.isfinite(lon):
-                lat = float(np.clip(lat, -90.0, 90.0))
-                lon = float(((lon + 180.0) % 360.0) - 180.0)
-                out.append([lat, lon])
-
-        return out
+        valid &= np.isfinite(lat) & np.isfinite(lon)
+        lat = np.clip(lat[valid], -90.0, 90.0)
+        lon = ((lon[valid] + 180.0) % 360.0) - 180.0
+        return lat, lon, valid
 
     def _invalidate_local_metric_transform(self, reason: str = ""):
         """Clear cached local-metric transform state (must be rebuilt from current bridge)."""
@@ -755,8 +656,7 @@ class OrbitMainApp(QMainWindow):
             alt_arr = pts[:, 2]
             return lon_arr, lat_arr, alt_arr
 
-        tx_to_wgs = Transformer.from_crs(src, 4326, always_xy=True)
-        lon_arr, lat_arr, alt_arr = tx_to_wgs.transform(pts[:, 0], pts[:, 1], pts[:, 2])
+        lon_arr, lat_arr, alt_arr = CoordinateSystem.from_epsg(src).to_wgs84(pts[:, 0], pts[:, 1], pts[:, 2])
         return np.asarray(lon_arr), np.asarray(lat_arr), np.asarray(alt_arr)
 
     def _wgs84_arrays_to_active_local_metric(self, lon_arr: np.ndarray, lat_arr: np.ndarray, alt_arr: np.ndarray):
@@ -781,6 +681,26 @@ class OrbitMainApp(QMainWindow):
         z_local = np.asarray(alt_arr, dtype=np.float64)
         return np.column_stack([x_local, y_local, z_local])
 
+    def _active_local_metric_arrays_to_wgs84(self, x_arr: np.ndarray, y_arr: np.ndarray, z_arr: np.ndarray):
+        """
+        Convert local metric arrays back to WGS84 arrays (lon, lat, alt).
+        Vectorized counterpart of the local_metric_to_wgs84 inverse transform.
+        """
+        center_lat = getattr(self, "_local_metric_center_lat", None)
+        center_lon = getattr(self, "_local_metric_center_lon", None)
+        if center_lat is None or center_lon is None:
+            raise RuntimeError("Local metric center is not initialized.")
+
+        R = 6_378_137.0
+        center_lat_rad = np.radians(float(center_lat))
+        center_lon_rad = np.radians(float(center_lon))
+
+        lat_rad = center_lat_rad + np.asarray(y_arr, dtype=np.float64) / R
+        lon_rad = center_lon_rad + np.asarray(x_arr, dtype=np.float64) / (R * np.cos(center_lat_rad))
+        lon_rad = (lon_rad + np.pi) % (2.0 * np.pi) - np.pi
+        lat = np.clip(np.degrees(lat_rad), -90.0, 90.0)
+        return np.degrees(lon_rad), lat, np.asarray(z_arr, dtype=np.float64)
+
     def _transform_source_points_to_active_local_metric(self, points_xyz: np.ndarray, source_epsg: int):
         """Convert Nx3 source CRS points directly into active local-metric coordinates."""
         if not self._has_active_local_metric_transform():
@@ -788,6 +708,40 @@ class OrbitMainApp(QMainWindow):
         lon_arr, lat_arr, alt_arr = self._source_points_to_wgs84_arrays(points_xyz, source_epsg)
         return self._wgs84_arrays_to_active_local_metric(lon_arr, lat_arr, alt_arr)
 
+    def _run_map_js(self, js_code, callback=None):
+        """Run js_code on the map page, or queue it while _update_map_visualization batches."""
+        if self._map_js_batch is not None:
+            if callback is None:
+                self._map_js_batch.append(js_code)
+                return
+            # Scripts with a result callback run on their own, after what is queued
+            self._flush_map_js(keep_batching=True)
+        if callback is None:
+            self.debug_page.runJavaScript(js_code)
+        else:
+            self.debug_page.runJavaScript(js_code, callback)
+
+    def _flush_map_js(self, keep_batching=False):
+        """Send the queued map scripts as one script; each part is isolated in try/catch."""
+        parts = self._map_js_batch or []
+        self._map_js_batch = [] if keep_batching else None
+        if parts:
+            self.debug_page.runJavaScript("\n".join(
+                f"try {{\n{part}\n}} catch (e) {{ console.error(e); }}" for part in parts
+            ))
+
+    def _schedule_map_update(self, delay_ms: int = 50):
+        """Coalesce map refresh requests into one _update_map_visualization() call."""
+        if self._map_update_pending:
+            return
+        self._map_update_pending = True
+        QTimer.singleShot(delay_ms, self._run_scheduled_map_update)
+
+    def _run_scheduled_map_update(self):
+        """Timer slot for _schedule_map_update()."""
+        self._map_update_pending = False
+        self._update_map_visualization()
+
     def _update_map_visualization(self):
         """Always push the live WGS84 lists to the web map (trajectory, pillars) and recenter."""
         debug_print("[DEBUG] _update_map_visualization called")
@@ -797,6 +751,15 @@ class OrbitMainApp(QMainWindow):
             debug_print("[MAP] No debug_page / web view yet; skipping map update")
             return
 
+        # Collect the layer pushes below into a single runJavaScript call
+        self._map_js_batch = []
+        try:
+            self._push_map_layers()
+        finally:
+            self._flush_map_js()
+
+    def _push_map_layers(self):
+        """Push trajectory, pillars and safety zones to the web map and recenter it."""
         # Idempotently ensure Leaflet layers exist
         try:
             js_bootstrap = """
@@ -815,7 +778,7 @@ class OrbitMainApp(QMainWindow):
                     }
                 }
             """
-            self.debug_page.runJavaScript(js_bootstrap)
+            self._run_map_js(js_bootstrap)
         except Exception as e:
             debug_print(f"[MAP] Layer bootstrap failed: {e}")
 
@@ -875,7 +838,7 @@ class OrbitMainApp(QMainWindow):
                             console.log('Map centered on single point');
                         }}
                     """
-                    self.debug_page.runJavaScript(js_center)
+                    self._run_map_js(js_center)
                 else:
                     # Fit bounds to extent
                     js_fit = f"""
@@ -885,7 +848,7 @@ class OrbitMainApp(QMainWindow):
                             console.log('Map fit to geometry bounds');
                         }}
                     """
-                    self.debug_page.runJavaScript(js_fit)
+                    self._run_map_js(js_fit)
             else:
                 debug_print("[MAP] No geometry available to center/fit map")
         except Exception as e:
@@ -905,14 +868,11 @@ class OrbitMainApp(QMainWindow):
             if not callable(proj2wgs):
                 return []
 
-            out = []
-            # pts is Nx3 (x,y,z) in PROJECT CRS
-            for row in pts:
-                x = float(row[0]); y = float(row[1])
-                z = float(row[2]) if len(row) >= 3 else 0.0
-                lon, lat, alt = proj2wgs(x, y, z)  # context returns lon,lat,alt
-                out.append([lat, lon, alt])
-            return out
+            # pts is Nx3 (x,y,z) in PROJECT CRS; transform all rows in one call
+            pts = np.asarray(pts, dtype=np.float64)
+            z = pts[:, 2] if pts.shape[1] >= 3 else np.zeros(len(pts))
+            lon, lat, alt = proj2wgs(pts[:, 0], pts[:, 1], z)  # context returns lon,lat,alt
+            return np.column_stack([lat, lon, alt]).tolist()
         except Exception as e:
             error_debug_print(f"[MAP] traj→WGS84 failed: {e}")
             return []
@@ -926,14 +886,19 @@ class OrbitMainApp(QMainWindow):
             if not callable(proj2wgs):
                 return []
 
-            out = []
             # If your pillars are model objects with x,y,z in project CRS:
-            for p in getattr(self.current_bridge, 'pillars', []) or []:
-                x = float(getattr(p, 'x', 0.0)); y = float(getattr(p, 'y', 0.0))
-                z = float(getattr(p, 'z', 0.0))
-                lon, lat, alt = proj2wgs(x, y, z)
-                out.append({'id': getattr(p, 'id', ''), 'lat': lat, 'lon': lon, 'z': alt})
-            return out
+            pillars = list(getattr(self.current_bridge, 'pillars', []) or [])
+            if not pillars:
+                return []
+            xyz = np.array(
+                [[float(getattr(p, 'x', 0.0)), float(getattr(p, 'y', 0.0)), float(getattr(p, 'z', 0.0))] for p in pillars],
+                dtype=np.float64,
+            )
+            lon, lat, alt = proj2wgs(xyz[:, 0], xyz[:, 1], xyz[:, 2])
+            return [
+                {'id': getattr(p, 'id', ''), 'lat': la, 'lon': lo, 'z': al}
+                for p, la, lo, al in zip(pillars, np.ravel(lat).tolist(), np.ravel(lon).tolist(), np.ravel(alt).tolist())
+            ]
         except Exception as e:
             error_debug_print(f"[MAP] pillars→WGS84 failed: {e}")
             return []
@@ -952,26 +917,49 @@ class OrbitMainApp(QMainWindow):
 
         debug_print(f"[DEBUG] Sending {len(safe_pts)} trajectory points to map")
 
-        try:
-            payload = json.dumps(safe_pts, allow_nan=False)
-        except ValueError:
-            # Fallback if someone sneaked a NaN in
-            payload = json.dumps([[float(lat), float(lon)] for lat, lon in safe_pts if np.isfinite(lat) and np.isfinite(lon)])
+        prev = self._map_trajectory_sent
+        self._map_trajectory_sent = safe_pts
+        n_prev = len(prev) if prev else 0
+        if n_prev >= 2 and len(safe_pts) > n_prev and safe_pts[:n_prev] == prev:
+            # Points were only appended (interactive drawing): extend the existing
+            # polyline. If the browser no longer shows what we last sent, the
+            # script returns false and the full trajectory is pushed instead.
+            added = json.dumps(safe_pts[n_prev:], separators=(',', ':'))
+            js_append = f'''
+                (function() {{
+                    var line = window.orbitTrajectoryLine;
+                    if (!line || !window.trajectoryLayer || !trajectoryLayer.hasLayer(line) ||
+                        line.getLatLngs().length !== {n_prev}) {{
+                        return false;
+                    }}
+                    {added}.forEach(function(p) {{ line.addLatLng(p); }});
+                    return true;
+                }})();
+            '''
+
+            def _on_appended(ok, pts=safe_pts):
+                # Only resend if no newer trajectory has been pushed meanwhile
+                if not ok and self._map_trajectory_sent is pts:
+                    self._push_full_trajectory(pts)
+
+            self._run_map_js(js_append, _on_appended)
+            return
+
+        self._push_full_trajectory(safe_pts)
+
+    def _push_full_trajectory(self, safe_pts):
+        """Replace the trajectory drawn on the map with safe_pts ([lat, lon] pairs)."""
+        payload = json.dumps(safe_pts, separators=(',', ':'))
 
         js_code = f'''
             console.log('Updating complete trajectory on map...');
             if (window.trajectoryLayer) {{
                 trajectoryLayer.clearLayers();
+                window.orbitTrajectoryLine = null;
 
                 var points = {payload};
                 console.log('Received ' + points.length + ' complete trajectory points');
 
-                // JS-side guard
-                points = points.filter(function(p) {{
-                    return Array.isArray(p) && p.length >= 2 &&
-                        Number.isFinite(p[0]) && Number.isFinite(p[1]);
-                }});
-
                 if (points.length >= 2) {{
                     var polyline = L.polyline(points, {{
                         color: 'blue',
@@ -980,6 +968,7 @@ class OrbitMainApp(QMainWindow):
                         dashArray: '5, 5',
                         className: 'complete-trajectory'
                     }}).addTo(trajectoryLayer);
+                    window.orbitTrajectoryLine = polyline;
 
                     console.log('Complete trajectory updated with ' + points.length + ' points');
                 }} else if (points.length === 1) {{
@@ -992,7 +981,7 @@ class OrbitMainApp(QMainWindow):
                 }}
             }}
         '''
-        self.debug_page.runJavaScript(js_code)
+        self._run_map_js(js_code)
     
     def _send_pillars_to_map(self, pillars):
         """Send pillar data to the map for visualization."""
@@ -1049,7 +1038,7 @@ class OrbitMainApp(QMainWindow):
                 }}
             }}
         '''
-        self.debug_page.runJavaScript(js_code)
+        self._run_map_js(js_code)
     
     def _transform_coordinates(self, points_list, source_coord_system, target_coord_system="WGS84"):
         """
@@ -3012,7 +3001,7 @@ class OrbitMainApp(QMainWindow):
             # Update the map visualization after loading
             if getattr(self, 'debug_page', None):
                 debug_print("[DEBUG] Triggering map visualization update after bridge load...")
-                self._update_map_visualization()
+                self._schedule_map_update()
 
             # Log success
             bname = getattr(bridge, 'name', 'Unknown Bridge')
@@ -3187,7 +3176,7 @@ class OrbitMainApp(QMainWindow):
 
             # Update map after context
             if getattr(self, 'debug_page', None):
-                self._update_map_visualization()
+                self._schedule_map_update()
 
             # Prefer the single, comprehensive state saver (keeps everything in 01_Input)
             # If you still call multiple savers elsewhere, consider deprecating them.
@@ -4233,7 +4222,7 @@ class OrbitMainApp(QMainWindow):
                 console.log('Completed safety zones visualization updated');
             }}
         '''
-        self.debug_page.runJavaScript(js_code)
+        self._run_map_js(js_code)
 
     def _send_current_zone_to_map(self, current_zone):
         """Send current zone being drawn to the map for visualization."""
@@ -4306,7 +4295,7 @@ class OrbitMainApp(QMainWindow):
             # Update map visualization when entering Tab 1
             if hasattr(self, 'debug_page') and self.debug_page:
                 debug_print("[DEBUG] Triggering map visualization update...")
-                self._update_map_visualization()
+                self._schedule_map_update()
         elif index == 0:  # Tab 0 - Project Setup
             debug_print("Navigated to Tab 0 - Project Setup")
 
@@ -5973,7 +5962,7 @@ class OrbitMainApp(QMainWindow):
             debug_print(f"  Z: {points[:, 2].min():.1f} to {points[:, 2].max():.1f}")
 
             source_epsg = coord_info["epsg"]
-            tx_to_wgs = Transformer.from_crs(source_epsg, 4326, always_xy=True)
+            tx_to_wgs = CoordinateSystem.from_epsg(source_epsg)
 
             # Determine centre lat/lon
             if getattr(self, 'current_trajectory', None):
@@ -5981,7 +5970,7 @@ class OrbitMainApp(QMainWindow):
                 center_lon = float(np.mean([pt[1] for pt in self.current_trajectory]))
             else:
                 m = min(10_000, n_pts)
-                lon_tmp, lat_tmp, _ = tx_to_wgs.transform(points[:m, 0], points[:m, 1], points[:m, 2])
+                lon_tmp, lat_tmp, _ = tx_to_wgs.to_wgs84(points[:m, 0], points[:m, 1], points[:m, 2])
                 center_lat = float(np.mean(lat_tmp))
                 center_lon = float(np.mean(lon_tmp))
 
@@ -6005,7 +5994,7 @@ class OrbitMainApp(QMainWindow):
                     end = min(start + batch_size, n_pts)
                     batch = points[start:end]
 
-                    lon_arr, lat_arr, alt_arr = tx_to_wgs.transform(batch[:, 0], batch[:, 1], batch[:, 2])
+                    lon_arr, lat_arr, alt_arr = tx_to_wgs.to_wgs84(batch[:, 0], batch[:, 1], batch[:, 2])
                     lon_diff_rad = np.radians(lon_arr - center_lon)
                     lon_diff_rad = (lon_diff_rad + np.pi) % (2*np.pi) - np.pi  # wrap
                     x_local = R * lon_diff_rad * np.cos(center_lat_rad)
@@ -11041,8 +11030,9 @@ class OrbitMainApp(QMainWindow):
                     safety_zones_clearance_adjust
                 )
                 
-                # Set the updated content back to tab3_textEdit
-                self.ui.tab3_textEdit.setHtml(updated_content)
+                # Set the updated content back to tab3_textEdit (only if it changed)
+                if updated_content != current_content:
+                    self.ui.tab3_textEdit.setHtml(updated_content)
                 
                 debug_print(f"[CLEARANCE] Updated tab3_textEdit with clearance information")
                 debug_print(f"[CLEARANCE] safety_zones_clearance = {safety_zones_clearance}")
@@ -11373,7 +11363,9 @@ class OrbitMainApp(QMainWindow):
         for var, val in (updates or {}).items():
             new_html = replace_var_in_html(new_html, var, val)
 
-        # Push back to the editor
+        # Push back to the editor; skip the reparse when nothing changed
+        if new_html == html_text:
+            return
         te.setHtml(new_html)
         debug_print(f"[TEXTBOX_UPDATE] ✓ Updated variables: {', '.join([k for k in updates.keys() if updates[k] not in (None, '*')])}")
 
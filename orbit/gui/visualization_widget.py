@@ -3,12 +3,15 @@ This is a pared-down copy of the original GUI/_visualization.py and only
 includes the bits needed for showing bridge & pillar meshes.
 Enhanced with improved navigation controls including double-click recentering.
 """
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QFrame, QPushButton, QSplitter, QLabel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QFrame, QPushButton, QSplitter
 from PySide6.QtCore import Qt, QTimer, QEvent
-from PySide6.QtGui import QColor, QMouseEvent
+from PySide6.QtGui import QColor, QShortcut, QKeySequence
 import pyvista as pv
 import os
+import math
+import time
 import numpy as np
+from contextlib import contextmanager
 from typing import Optional
 
 # Debug control functions - use the same pattern as main app
@@ -33,7 +36,13 @@ def error_debug_print(*args, **kwargs) -> None:
     """Print function that always outputs (for errors)."""
     print(*args, **kwargs)
 
+# Largest coordinate magnitude (m) at which float32 vertices keep ~1 mm resolution
+_FLOAT32_SAFE_EXTENT = 1.0e4
+
 class VisualizationWidget(QWidget):
+    # Side-panel button stylesheets keyed by (rgb color or None, visible)
+    _button_style_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -86,6 +95,10 @@ class VisualizationWidget(QWidget):
         self.buttons = {}  # label -> QPushButton
         self._opaque_mode_active = True
         self._opaque_target_idents = set()
+
+        # Render batching: render() calls inside _deferred_render() collapse into one
+        self._render_defer_depth = 0
+        self._render_pending = False
         
         # Navigation enhancement variables
         self._click_timer = QTimer()
@@ -111,7 +124,6 @@ class VisualizationWidget(QWidget):
 
         # Spacebar shortcut to trigger/toggle auto-orbit
         try:
-            from PySide6.QtGui import QShortcut, QKeySequence
             self._orbit_shortcut = QShortcut(QKeySequence(Qt.Key_Space), self.plotter.interactor)
             self._orbit_shortcut.setAutoRepeat(False)
             self._orbit_shortcut.activated.connect(self._toggle_auto_orbit)
@@ -120,7 +132,6 @@ class VisualizationWidget(QWidget):
 
         # E shortcut to toggle opaque mode for point-clouds / bridge meshes
         try:
-            from PySide6.QtGui import QShortcut, QKeySequence
             self._opaque_shortcut = QShortcut(QKeySequence(Qt.Key_E), self.plotter.interactor)
             self._opaque_shortcut.setAutoRepeat(False)
             self._opaque_shortcut.activated.connect(self._toggle_opaque_mode)
@@ -129,13 +140,47 @@ class VisualizationWidget(QWidget):
 
         # R shortcut to toggle perspective/orthogonal projection
         try:
-            from PySide6.QtGui import QShortcut, QKeySequence
             self._projection_shortcut = QShortcut(QKeySequence(Qt.Key_R), self.plotter.interactor)
             self._projection_shortcut.setAutoRepeat(False)
             self._projection_shortcut.activated.connect(self._toggle_projection_mode)
         except Exception:
             pass
 
+    # ------------------------------------------------------------------
+    # Render batching
+    # ------------------------------------------------------------------
+    def _render(self):
+        """Render now, or mark a render as pending inside a deferred block."""
+        if self._render_defer_depth:
+            self._render_pending = True
+            return
+        self._maybe_render()
+
+    def _maybe_render(self):
+        """Render only while the 3-D view is shown.
+
+        A hidden view (e.g. its tab is not selected) is redrawn by Qt's paint
+        event when it becomes visible again, so rendering it now is wasted work.
+        """
+        try:
+            if not self.plotter.interactor.isVisible():
+                return
+        except Exception:
+            pass
+        self.plotter.render()
+
+    @contextmanager
+    def _deferred_render(self):
+        """Collapse all renders requested inside the block into a single one at exit."""
+        self._render_defer_depth += 1
+        try:
+            yield
+        finally:
+            self._render_defer_depth -= 1
+            if self._render_defer_depth == 0 and self._render_pending:
+                self._render_pending = False
+                self._maybe_render()
+
     # ------------------------------------------------------------------
     # Mesh loading helpers
     # ------------------------------------------------------------------
@@ -147,8 +192,13 @@ class VisualizationWidget(QWidget):
         """
         ident = os.path.abspath(ply_path)
 
-        # If same file already present, replace its actor
+        # If same file already present, replace its actor. A button already showing
+        # this file under the same name is kept in place and only restyled, which
+        # avoids a widget teardown and side-panel relayout on every reload.
+        reused_button = None
         if ident in self.meshes:
+            if self._display_to_ident.get(name) == ident:
+                reused_button = self.buttons.pop(name, None)
             self._remove_mesh(ident)
 
         self._load_mesh(ident, color=color, opacity=opacity)
@@ -159,7 +209,11 @@ class VisualizationWidget(QWidget):
         self._display_to_ident[name] = ident
 
         # Create a button labeled with the display name
-        self._add_button(name, ident, color)
+        if reused_button is not None:
+            self.buttons[name] = reused_button
+            self._style_button(reused_button, color, True)
+        else:
+            self._add_button(name, ident, color)
 
         # Register as safety-zone only if asked
         if is_safety_zone:
@@ -185,21 +239,29 @@ class VisualizationWidget(QWidget):
                 return (np.clip(arr, 0.0, 1.0) * 255.0).astype(np.uint8)
             return np.clip(arr, 0, 255).astype(np.uint8)
 
+        def _stack_channels(*channels):
+            # Fill one contiguous uint8 (N, 3) buffer so VTK gets ready-to-upload
+            # colors without the extra copy of np.column_stack
+            rgb = np.empty((len(channels[0]), 3), dtype=np.uint8)
+            for col, channel in enumerate(channels):
+                rgb[:, col] = _to_uint8(channel)
+            return rgb
+
         if color is not None:
             add_kwargs['color'] = color
         else:
             keys = set(mesh.point_data.keys())
             if {'red', 'green', 'blue'}.issubset(keys):
-                rgb = np.column_stack([
-                    _to_uint8(mesh.point_data['red']),
-                    _to_uint8(mesh.point_data['green']),
-                    _to_uint8(mesh.point_data['blue'])])
+                rgb = _stack_channels(
+                    mesh.point_data['red'],
+                    mesh.point_data['green'],
+                    mesh.point_data['blue'])
                 add_kwargs.update({'scalars': rgb, 'rgb': True})
             elif {'diffuse_red', 'diffuse_green', 'diffuse_blue'}.issubset(keys):
-                rgb = np.column_stack([
-                    _to_uint8(mesh.point_data['diffuse_red']),
-                    _to_uint8(mesh.point_data['diffuse_green']),
-                    _to_uint8(mesh.point_data['diffuse_blue'])])
+                rgb = _stack_channels(
+                    mesh.point_data['diffuse_red'],
+                    mesh.point_data['diffuse_green'],
+                    mesh.point_data['diffuse_blue'])
                 add_kwargs.update({'scalars': rgb, 'rgb': True})
             elif 'RGB' in keys:
                 rgb_arr = mesh.point_data['RGB']
@@ -211,10 +273,25 @@ class VisualizationWidget(QWidget):
 
     def _load_mesh(self, ident, color=None, opacity=1.0):
         mesh = pv.read(ident)
+        self._compact_points(mesh)
         add_kwargs = self._extract_color_kwargs(mesh, color=color, opacity=opacity)
         actor = self.plotter.add_mesh(mesh, **add_kwargs)
         self.meshes[ident] = dict(mesh=mesh, actor=actor, visible=True, color=color, opacity=float(opacity))
 
+    @staticmethod
+    def _compact_points(mesh) -> None:
+        """Store float64 vertex coordinates as contiguous float32 when that is lossless enough.
+
+        Only applied while every coordinate stays below ``_FLOAT32_SAFE_EXTENT``,
+        where float32 still resolves about a millimetre; meshes in large projected
+        coordinates keep their float64 points.
+        """
+        points = getattr(mesh, 'points', None)
+        if points is None or len(points) == 0 or points.dtype != np.float64:
+            return
+        if float(np.abs(points).max()) < _FLOAT32_SAFE_EXTENT:
+            mesh.points = np.ascontiguousarray(points, dtype=np.float32)
+
     def _set_actor_opacity(self, actor, opacity: float) -> None:
         """Safely set actor opacity across PyVista/VTK variants."""
         try:
@@ -237,25 +314,35 @@ class VisualizationWidget(QWidget):
             return
         self._opaque_target_idents.add(ident)
 
-    def _apply_opaque_state_to_ident(self, ident: str) -> None:
-        """Apply current opaque-mode state to one tracked mesh actor."""
+    def _apply_opaque_state_to_ident(self, ident: str) -> bool:
+        """Apply current opaque-mode state to one tracked mesh actor.
+
+        Returns True only if the actor's opacity actually changed, so callers
+        can skip the render when nothing needs redrawing.
+        """
         if ident not in self._opaque_target_idents:
-            return
+            return False
         info = self.meshes.get(ident)
         if not info:
-            return
+            return False
         target_opacity = 1.0 if self._opaque_mode_active else float(info.get('opacity', 1.0))
+        if info.get('applied_opacity') == target_opacity:
+            return False
         self._set_actor_opacity(info.get('actor'), target_opacity)
+        info['applied_opacity'] = target_opacity
+        return True
 
     def _toggle_opaque_mode(self) -> None:
         """Toggle between default and opaque rendering for point-cloud/bridge meshes."""
         self._opaque_mode_active = not self._opaque_mode_active
+        changed = False
         for ident in list(self._opaque_target_idents):
             if ident not in self.meshes:
                 self._opaque_target_idents.discard(ident)
                 continue
-            self._apply_opaque_state_to_ident(ident)
-        self.plotter.render()
+            changed = self._apply_opaque_state_to_ident(ident) or changed
+        if changed:
+            self._render()
         state = "ON" if self._opaque_mode_active else "OFF"
         debug_print(f"[VIS] Opaque mode {state} (toggle with 'e')")
 
@@ -266,7 +353,7 @@ class VisualizationWidget(QWidget):
             is_parallel = bool(camera.GetParallelProjection())
             camera.SetParallelProjection(not is_parallel)
             self.plotter.reset_camera_clipping_range()
-            self.plotter.render()
+            self._render()
             mode = "ORTHOGONAL" if not is_parallel else "PERSPECTIVE"
             debug_print(f"[VIS] Projection mode {mode} (toggle with 'r')")
         except Exception as e:
@@ -321,7 +408,7 @@ class VisualizationWidget(QWidget):
         self._apply_opaque_state_to_ident(name)
         self._display_to_ident[name] = name
         self._add_button(name, name, color)
-        self.plotter.render()
+        self._render()
         debug_print(f"[VIS] Added in-memory mesh '{name}' ({mesh.n_points:,} pts)")
 
     def add_mesh_group_from_data(self, name, parts, opacity=1.0):
@@ -388,7 +475,7 @@ class VisualizationWidget(QWidget):
         )
         self._display_to_ident[name] = name
         self._add_button(name, name, None)
-        self.plotter.render()
+        self._render()
         debug_print(f"[VIS] Added grouped mesh '{name}' ({len(group_members)} parts)")
 
     def _remove_mesh(self, ident):
@@ -455,13 +542,18 @@ class VisualizationWidget(QWidget):
         self.buttons[label] = btn
 
     def _style_button(self, button, color, on=True):
-        if color and on:
-            col = QColor(*(int(c*255) for c in color))
-            bg = f"rgb({col.red()}, {col.green()}, {col.blue()})"
-        else:
-            bg = 'lightgrey' if on else 'transparent'
-        txt = 'black' if on else 'grey'
-        button.setStyleSheet(f"QPushButton{{background-color:{bg};color:{txt};padding:4px;border-radius:4px;}}");
+        key = (tuple(color) if color and on else None, bool(on))
+        style = self._button_style_cache.get(key)
+        if style is None:
+            if color and on:
+                col = QColor(*(int(c*255) for c in color))
+                bg = f"rgb({col.red()}, {col.green()}, {col.blue()})"
+            else:
+                bg = 'lightgrey' if on else 'transparent'
+            txt = 'black' if on else 'grey'
+            style = f"QPushButton{{background-color:{bg};color:{txt};padding:4px;border-radius:4px;}}"
+            self._button_style_cache[key] = style
+        button.setStyleSheet(style)
 
     def _toggle_visibility(self, ident, button):
         info = self.meshes.get(ident)
@@ -484,7 +576,7 @@ class VisualizationWidget(QWidget):
 
             info['visible'] = make_visible
             self._style_button(button, info.get('color'), make_visible)
-            self.plotter.render()
+            self._render()
             return
 
         if info['visible']:
@@ -495,7 +587,7 @@ class VisualizationWidget(QWidget):
             self.plotter.add_actor(info['actor'])
             info['visible'] = True
             self._style_button(button, info['color'], True)
-        self.plotter.render() 
+        self._render()
 
     # ------------------------------------------------------------------
     # Enhanced Navigation Controls
@@ -519,15 +611,11 @@ class VisualizationWidget(QWidget):
                     if hasattr(style, 'SetMouseWheelMotionFactor'):
                         style.SetMouseWheelMotionFactor(1.0)
             
-            # Alternative approach - use Qt event handling instead of VTK observer
+            # Clicks are handled by the Qt event filter only. A second VTK
+            # LeftButtonPressEvent observer would see the same press, share the
+            # double-click timer and trigger an extra pick per click.
             self.plotter.interactor.installEventFilter(self)
             
-            # Also try VTK observer as backup
-            try:
-                self.plotter.iren.AddObserver('LeftButtonPressEvent', self._on_left_click)
-            except Exception as e:
-                pass  # Silent fallback
-            
             debug_print("[NAVIGATION] Enhanced navigation controls initialized")
             debug_print("[NAVIGATION] - Double-click to recenter on point")
             debug_print("[NAVIGATION] - Improved rotation sensitivity")
@@ -536,24 +624,6 @@ class VisualizationWidget(QWidget):
         except Exception as e:
             debug_print(f"[NAVIGATION] Warning: Could not setup enhanced navigation: {e}")
 
-    def _on_left_click(self, obj, event):
-        """Handle left mouse clicks for double-click detection."""
-        try:
-            # Get click position
-            click_pos = self.plotter.iren.GetEventPosition()
-            
-            if self._click_timer.isActive():
-                # This is a potential double-click
-                self._click_timer.stop()
-                self._handle_double_click(click_pos)
-            else:
-                # Start timer for single click
-                self._last_click_pos = click_pos
-                self._click_timer.start(self._double_click_threshold)
-                
-        except Exception as e:
-            error_debug_print(f"[NAVIGATION] Error in click handling: {e}")
-
     def eventFilter(self, obj, event):
         """Qt event filter to handle mouse events."""
         try:
@@ -664,29 +734,6 @@ class VisualizationWidget(QWidget):
         """Handle single click (currently does nothing special)."""
         pass  # Single clicks are handled by default PyVista behavior
 
-    def _handle_double_click(self, click_pos):
-        """Handle double-click to recenter camera on the clicked point."""
-        try:
-            # Perform picking to find the 3D point
-            picker = self.plotter.iren.GetPicker()
-            
-            if picker:
-                # Pick at the click position
-                result = picker.Pick(click_pos[0], click_pos[1], 0, self.plotter.renderer)
-                
-                picked_point = picker.GetPickPosition()
-                
-                if picked_point and any(picked_point):  # Check if we got a valid point
-                    self._recenter_camera_on_point(picked_point)
-                else:
-                    # If no surface was picked, try to find closest mesh point
-                    self._recenter_on_closest_mesh_point(click_pos)
-            else:
-                self._recenter_on_closest_mesh_point(click_pos)
-                
-        except Exception as e:
-            debug_print(f"[NAVIGATION] Error in double-click handling: {e}")
-
     def _recenter_camera_on_point(self, point):
         """Recenter the camera to look at the specified 3D point."""
         try:
@@ -713,7 +760,7 @@ class VisualizationWidget(QWidget):
             
             # Update the view
             self.plotter.reset_camera_clipping_range()
-            self.plotter.render()
+            self._render()
             
         except Exception as e:
             debug_print(f"[NAVIGATION] Error recentering camera: {e}")
@@ -724,23 +771,20 @@ class VisualizationWidget(QWidget):
             # Convert screen coordinates to world coordinates
             # This is a fallback when surface picking fails
             
-            # Get all visible meshes and find their center
-            visible_meshes = [info['mesh'] for info in self.meshes.values() if info['visible']]
+            # Stack the bounds of all visible meshes into one (M, 6) array.
+            # Group entries carry no mesh of their own; their parts are listed separately.
+            bounds = np.asarray(
+                [info['mesh'].bounds for info in self.meshes.values()
+                 if info.get('visible') and info.get('mesh') is not None],
+                dtype=float,
+            )
             
-            if visible_meshes:
-                # Calculate combined center of all visible meshes
-                all_centers = []
-                for mesh in visible_meshes:
-                    center = mesh.center
-                    all_centers.append(center)
-                
-                if all_centers:
-                    # Use average center as fallback recenter point
-                    avg_center = np.mean(all_centers, axis=0)
-                    debug_print(f"[NAVIGATION] Using average mesh center as fallback: {avg_center}")
-                    self._recenter_camera_on_point(avg_center)
-                else:
-                    debug_print("[NAVIGATION] No mesh centers available")
+            if len(bounds):
+                # Use average bounding-box center as fallback recenter point
+                centers = 0.5 * (bounds[:, 0::2] + bounds[:, 1::2])
+                avg_center = centers.mean(axis=0)
+                debug_print(f"[NAVIGATION] Using average mesh center as fallback: {avg_center}")
+                self._recenter_camera_on_point(avg_center)
             else:
                 debug_print("[NAVIGATION] No visible meshes to recenter on")
                 
@@ -755,7 +799,7 @@ class VisualizationWidget(QWidget):
                 debug_print(f"[CLEANUP] No mapping for display name '{name}'")
                 return
             self._remove_mesh(ident)
-            self.plotter.render()
+            self._render()
         except Exception as e:
             debug_print(f"[CLEANUP] Error removing '{name}': {e}")
 
@@ -765,19 +809,21 @@ class VisualizationWidget(QWidget):
             names = list(self._safety_zone_registry)
             debug_print(f"[CLEANUP] Removing {len(names)} safety zone(s) via registry…")
             removed = 0
-            for name in names:
-                try:
-                    self.remove_mesh_by_name(name)
-                    removed += 1
-                except Exception as e:
-                    debug_print(f"[CLEANUP] Warning: Failed to remove '{name}': {e}")
-
-            # Clear registry after attempted removal
-            self._safety_zone_registry.clear()
-
-            if hasattr(self, 'plotter'):
-                self.plotter.render()
-                debug_print("[CLEANUP] Forced render after safety zone removal")
+            # One render for the whole cleanup instead of one per removed zone
+            with self._deferred_render():
+                for name in names:
+                    try:
+                        self.remove_mesh_by_name(name)
+                        removed += 1
+                    except Exception as e:
+                        debug_print(f"[CLEANUP] Warning: Failed to remove '{name}': {e}")
+
+                # Clear registry after attempted removal
+                self._safety_zone_registry.clear()
+
+                if hasattr(self, 'plotter'):
+                    self._render()
+                    debug_print("[CLEANUP] Forced render after safety zone removal")
 
             debug_print(f"[CLEANUP] Successfully removed {removed}/{len(names)} safety zone(s)")
         except Exception as e:
@@ -786,9 +832,6 @@ class VisualizationWidget(QWidget):
 
 
 
-
-
-
     def add_polyline(self, name, points, color=(1.0, 0.0, 0.0), line_width=3, tube_radius=0.4,
                      save_obj_path: Optional[str] = None):
         """Add or replace a poly-line (flight route) in the scene.
@@ -809,9 +852,6 @@ class VisualizationWidget(QWidget):
         save_obj_path : str | None
             If given the generated mesh is also saved to the specified *.obj* file.
         """
-        import numpy as np
-        import pyvista as pv
-
         # ------------------------------------------------------------------
         # 1. Remove existing actor/button with same name (duplicate-prevention)
         # ------------------------------------------------------------------
@@ -831,8 +871,12 @@ class VisualizationWidget(QWidget):
             raise ValueError("add_polyline expects an Nx3 array of points ≥ 2 waypoints")
 
         poly = pv.PolyData(pts)
-        # lines array = [nPointsSubLine, id0, id1, nPointsSubLine, ...]
-        poly.lines = np.hstack([[2, i, i + 1] for i in range(len(pts) - 1)])
+        # lines array = [nPointsSubLine, id0, id1, nPointsSubLine, ...], built as one (n-1, 3) block
+        lines = np.empty((len(pts) - 1, 3), dtype=np.int64)
+        lines[:, 0] = 2
+        lines[:, 1] = np.arange(len(pts) - 1)
+        lines[:, 2] = lines[:, 1] + 1
+        poly.lines = lines.ravel()
 
         # Generate geometry
         using_tube = tube_radius and tube_radius > 0
@@ -862,7 +906,7 @@ class VisualizationWidget(QWidget):
         self.meshes[name] = dict(mesh=mesh, actor=actor, visible=True, color=color, opacity=1.0)
         self._opaque_target_idents.discard(name)
         self._add_button(name, name, color)
-        self.plotter.render()
+        self._render()
 
         # ------------------------------------------------------------------
         # 4. Optional save to OBJ
@@ -902,11 +946,10 @@ class VisualizationWidget(QWidget):
             # Enforce Z-up view for a proper Z-axis orbit
             camera.SetViewUp(0, 0, 1)
 
-            self._orbit_initial_offset = initial_offset
+            self._orbit_initial_offset = tuple(float(v) for v in initial_offset)
             self._orbit_total_sec = max(0.1, float(duration_sec))
             # Use high-resolution monotonic timer
-            import time as _time
-            self._orbit_start_time = _time.perf_counter()
+            self._orbit_start_time = time.perf_counter()
             self._orbit_active = True
             self._orbit_timer.start()
         except Exception as e:
@@ -929,14 +972,14 @@ class VisualizationWidget(QWidget):
             self._stop_auto_orbit()
             return
         try:
-            import time as _time
-            elapsed = _time.perf_counter() - self._orbit_start_time
+            elapsed = time.perf_counter() - self._orbit_start_time
             progress = max(0.0, min(1.0, elapsed / float(self._orbit_total_sec)))
 
-            # Compute rotation angle around the world Z-axis
-            angle = 2.0 * np.pi * progress
-            cos_a = np.cos(angle)
-            sin_a = np.sin(angle)
+            # Compute rotation angle around the world Z-axis. Plain float math keeps
+            # this 60 Hz path free of per-frame NumPy temporaries.
+            angle = 2.0 * math.pi * progress
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
 
             ox, oy, oz = self._orbit_initial_offset
             rx = ox * cos_a - oy * sin_a
@@ -944,16 +987,15 @@ class VisualizationWidget(QWidget):
             rz = oz
 
             camera = self.plotter.camera
-            focal_point = np.array(camera.GetFocalPoint(), dtype=float)
-            new_pos = focal_point + np.array([rx, ry, rz], dtype=float)
+            fx, fy, fz = camera.GetFocalPoint()
 
-            camera.SetPosition(float(new_pos[0]), float(new_pos[1]), float(new_pos[2]))
-            camera.SetFocalPoint(float(focal_point[0]), float(focal_point[1]), float(focal_point[2]))
+            camera.SetPosition(fx + rx, fy + ry, fz + rz)
+            camera.SetFocalPoint(fx, fy, fz)
             camera.SetViewUp(0, 0, 1)
 
             # Keep clipping sane during animation
             self.plotter.reset_camera_clipping_range()
-            self.plotter.render()
+            self._render()
 
             if progress >= 1.0:
                 # Snap to exact end and stop
@@ -975,6 +1017,11 @@ class VisualizationWidget(QWidget):
             List of dicts with keys: file_path, display_name, color, opacity, is_safety_zone
         """
         assets = []
+        # Invert _display_to_ident once (first name wins) instead of scanning it per mesh
+        ident_to_name = {}
+        for name, mapped_ident in self._display_to_ident.items():
+            ident_to_name.setdefault(mapped_ident, name)
+
         for ident, info in self.meshes.items():
             if not info.get('visible', False):
                 continue  # Skip hidden meshes
@@ -987,11 +1034,8 @@ class VisualizationWidget(QWidget):
                 debug_print(f"[VIS] Skipping in-memory mesh '{ident}' - cannot persist without file path")
                 continue
             
-            # Find display name by inverting _display_to_ident mapping
-            display_name = next(
-                (name for name, mapped_ident in self._display_to_ident.items() if mapped_ident == ident),
-                ident  # Fallback to ident if no mapping found
-            )
+            # Fallback to ident if no mapping found
+            display_name = ident_to_name.get(ident, ident)
             
             assets.append({
                 'file_path': file_path,
@@ -1047,6 +1091,6 @@ class VisualizationWidget(QWidget):
                         self._apply_opaque_state_to_ident(ident)
                 debug_print(f"[VIS] Opaque mode restored: {opaque_mode}")
             
-            self.plotter.render()
+            self._render()
         except Exception as e:
             debug_print(f"[VIS] Failed to restore camera state: {e}")
\ No newline at end of file
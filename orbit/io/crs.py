@@ -7,6 +7,7 @@ support arbitrary regional or global projections (UTM, national grids, etc.).
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Tuple
 
 from pyproj import CRS, Transformer
@@ -42,8 +43,14 @@ class CoordinateSystem:
         self._inv = Transformer.from_crs(self.crs, WGS84, always_xy=self.always_xy)
     
     @classmethod
+    @lru_cache(maxsize=None)
     def from_epsg(cls, epsg_code: int, always_xy: bool = True) -> "CoordinateSystem":
-        """Create a CoordinateSystem from an EPSG code."""
+        """Create a CoordinateSystem from an EPSG code.
+
+        Instances are cached per code: building the two transformers takes
+        ~10 ms, and the transforms accept NumPy arrays, so callers should
+        pass whole coordinate arrays rather than looping over points.
+        """
         return cls(epsg_code, always_xy)
 
     # ---------------------------------------------------------------------
@@ -177,6 +177,7 @@ class OrbitFlightExporter:
         self.config = config or self._get_default_config()
         self.export_paths = []
         self.flight_speed_map = {}
+        self._speed_by_tag = {}
         self.WPML_NS = "http://www.dji.com/wpmz/1.0.3"
         self.KML_NS  = "http://www.opengis.net/kml/2.2"
         # Load configuration from app instance if available
@@ -219,8 +220,10 @@ class OrbitFlightExporter:
         else:
             debug_print("   ⚠️  No payloadEnumValue found in parsed data")
         
-        # Get flight speed mapping
-        self.flight_speed_map = flight_data.get("flight_speed_map", {})
+        # Get flight speed mapping; speeds are converted to float once here
+        # rather than per waypoint (older project files quote the values)
+        self.flight_speed_map = self._normalize_speed_map(flight_data.get("flight_speed_map", {}))
+        self._speed_by_tag = {}
         if self.flight_speed_map:
             debug_print(f"   🚀 Loaded flight speed map with {len(self.flight_speed_map)} routes")
         
@@ -1000,29 +1003,36 @@ class OrbitFlightExporter:
         ET.SubElement(placemark, f"{{{self.WPML_NS}}}useStraightLine").text = "1"
         ET.SubElement(placemark, f"{{{self.WPML_NS}}}isRisky").text = "0"
     
+    @staticmethod
+    def _normalize_speed_map(speed_map: Dict[str, Any]) -> Dict[str, float]:
+        """Reduce a flight_speed_map to {route_key: speed}, dropping invalid entries."""
+        speeds = {}
+        for route_key, speed_info in (speed_map or {}).items():
+            if isinstance(speed_info, dict) and "speed" in speed_info:
+                try:
+                    speeds[route_key] = float(speed_info["speed"])
+                except (ValueError, TypeError):
+                    continue
+        return speeds
+
     def _get_flight_speed_for_tag(self, tag: str) -> float:
         """Get the flight speed for a specific waypoint tag."""
-        # Try to match tag to speed map
-        if self.flight_speed_map:
-            # Direct match
-            if tag in self.flight_speed_map:
-                speed_info = self.flight_speed_map[tag]
-                if isinstance(speed_info, dict) and "speed" in speed_info:
-                    try:
-                        return float(speed_info["speed"])
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Pattern matching for tags like "101_1", "underdeck_2_3", etc.
-            for route_key in self.flight_speed_map:
-                if route_key in tag or tag.startswith(route_key):
-                    speed_info = self.flight_speed_map[route_key]
-                    if isinstance(speed_info, dict) and "speed" in speed_info:
-                        try:
-                            return float(speed_info["speed"])
-                        except (ValueError, TypeError):
-                            continue
-        
+        # Waypoints share a handful of tags, so resolve each tag only once
+        if tag in self._speed_by_tag:
+            speed = self._speed_by_tag[tag]
+        else:
+            # Direct match, then pattern matching for tags like "101_1", "underdeck_2_3", etc.
+            speed = self.flight_speed_map.get(tag)
+            if speed is None:
+                for route_key, route_speed in self.flight_speed_map.items():
+                    if route_key in tag or tag.startswith(route_key):
+                        speed = route_speed
+                        break
+            self._speed_by_tag[tag] = speed
+
+        if speed is not None:
+            return speed
+
         # Fallback to global speed
         return self.config.get("global_speed", 2.0)
     
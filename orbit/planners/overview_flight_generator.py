@@ -52,7 +52,7 @@ class EnhancedPhotoParameters:
     # Standard flight route configurations
     standard_flight_routes: Dict[str, Dict[str, float]] = None
     order: List[str] = None
-    flight_speed_map: Dict[str, Dict[str, str]] = None
+    flight_speed_map: Dict[str, Dict[str, float]] = None
     
     # Other flight parameters (removed outdated ones)
     connection_height: float = 20.0
@@ -76,9 +76,9 @@ class EnhancedPhotoParameters:
         
         if self.flight_speed_map is None:
             self.flight_speed_map = {
-                "101": {"speed": "6"}, "102": {"speed": "4"},
-                "201": {"speed": "6"}, "202": {"speed": "4"},
-                "underdeck_safe_flythrough": {"speed": "2"}
+                "101": {"speed": 6}, "102": {"speed": 4},
+                "201": {"speed": 6}, "202": {"speed": 4},
+                "underdeck_safe_flythrough": {"speed": 2}
             }
 
 
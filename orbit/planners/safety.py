@@ -216,12 +216,13 @@ class SafetyProcessor:
 
         # Convert points to list for modification
         adjusted_route = [list(point) for point in self.flight_route]
-        points_to_remove = set()
+        # Boolean mask of points marked for deletion (cheaper than a set of ints)
+        remove_mask = np.zeros(len(adjusted_route), dtype=np.bool_)
 
         print("\n=== Applying Safety Zone Adjustments ===")
         # Process each point that's in one or more safety zones
         for point_idx, zone_indices in points_by_idx.items():
-            if point_idx in points_to_remove:
+            if remove_mask[point_idx]:
                 continue
 
             # NEW: Handle overlapping zones by prioritizing the highest adjustment value
@@ -265,7 +266,7 @@ class SafetyProcessor:
 
             if adjustment_value == 0:
                 print("Action: Remove point")
-                points_to_remove.add(point_idx)
+                remove_mask[point_idx] = True
             elif adjustment_value == -1:
                 print("Action: Redirect around zone")
                 new_points = self._shift_point_outside_zone(adjusted_route[point_idx], self.safety_zones[zone_idx], z_min, z_max)
@@ -284,9 +285,13 @@ class SafetyProcessor:
                 adjusted_route[point_idx][2] = new_height
 
         # Remove marked points
-        if points_to_remove:
-            adjusted_route = [point for i, point in enumerate(adjusted_route) if i not in points_to_remove]
-            print(f"\nRemoved {len(points_to_remove)} points marked for deletion")
+        num_removed = int(np.count_nonzero(remove_mask))
+        if num_removed:
+            # Redirects may have grown the route; inserted points are always kept
+            keep = np.ones(len(adjusted_route), dtype=np.bool_)
+            keep[:len(remove_mask)] = ~remove_mask
+            adjusted_route = [adjusted_route[i] for i in np.flatnonzero(keep).tolist()]
+            print(f"\nRemoved {num_removed} points marked for deletion")
 
         print(f"\nRoute points after adjustment: {len(adjusted_route)}")
         print("First 5 adjusted points that were in safety zones:")
@@ -294,7 +299,7 @@ class SafetyProcessor:
         for i, point in enumerate(adjusted_route):
             if points_shown >= 5:
                 break
-            if any(i == idx for idx, _ in points_in_zones if idx not in points_to_remove):
+            if any(i == idx for idx, _ in points_in_zones if not remove_mask[idx]):
                 print(f"Point {i}: {point}")
                 points_shown += 1
 
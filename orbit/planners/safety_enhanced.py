@@ -164,26 +164,37 @@ class EnhancedSafetyProcessor:
         if len(self.flight_route) < 2:
             return self.flight_route
 
-        resampled_route = [list(self.flight_route[0])]
-        
-        for i in range(1, len(self.flight_route)):
-            p1 = np.array(self.flight_route[i - 1][:3], dtype=float)
-            p2 = np.array(self.flight_route[i][:3], dtype=float)
-            
-            distance = np.linalg.norm(p2 - p1)
-            
-            if distance > interval:
-                num_points = int(distance / interval)
-                for j in range(1, num_points + 1):
-                    t = j / (num_points + 1)
-                    interpolated = p1 + t * (p2 - p1)
-                    interp_list = interpolated.tolist()
-                    # Preserve tag from first point if available
-                    if len(self.flight_route[i - 1]) > 3:
-                        interp_list.append(self.flight_route[i - 1][3])
-                    resampled_route.append(interp_list)
-            
-            resampled_route.append(list(self.flight_route[i]))
+        route = self.flight_route
+        coords = np.asarray([p[:3] for p in route], dtype=float)
+        # Optional tag column, carried from the first point of each segment
+        tags = [p[3:4] for p in route]
+
+        deltas = np.diff(coords, axis=0)
+        distances = np.linalg.norm(deltas, axis=1)
+        counts = np.where(distances > interval, (distances / interval).astype(int), 0)
+
+        # Output slot of every original point: its index plus all points inserted before it
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        orig_pos = np.arange(len(route)) + offsets
+
+        # Interpolated points: segment index and step j (1..n) within that segment
+        seg_idx = np.repeat(np.arange(len(route) - 1), counts)
+        steps = np.arange(len(seg_idx)) - np.repeat(offsets[:-1], counts) + 1
+        t = steps / (counts[seg_idx] + 1)
+
+        out = np.empty((len(route) + len(seg_idx), 3), dtype=float)
+        out[orig_pos] = coords
+        interp_pos = orig_pos[seg_idx] + steps
+        out[interp_pos] = coords[seg_idx] + t[:, None] * deltas[seg_idx]
+
+        resampled_route = out.tolist()
+        for i, pos in enumerate(orig_pos.tolist()):
+            resampled_route[pos] = list(route[i])
+        # Untagged routes need no per-point pass; otherwise extend in place with the
+        # segment's tag slice, captured once per source point above
+        if any(tags):
+            for seg, pos in zip(seg_idx.tolist(), interp_pos.tolist()):
+                resampled_route[pos] += tags[seg]
 
         debug_print(f"Route resampled from {len(self.flight_route)} to {len(resampled_route)} points")
         self.flight_route = resampled_route
@@ -6,6 +6,135 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
+\x00\x00\x07\xe6\
+(\
+\xb5/\xfd`H \xe5>\x00\x8aC\x04\x0c%\x00\xb3\
+\xe6l\x9c\xb1\xe4V\xd3v\xb6t\x93\xb4[/\x0bu\
+\xabR\xee\xcc\xf0\x12#<n\x05\x90\xa46\xec\xff\xff\
+n\x86y\xac\x00\xba\x00\xbb\x00I\xc5u\xb1\xfb\x1b\xb3\
+\xe0\x98\x9eC\xaa\xf4\xa3g\xe7\xf0 \xdb\xe1\x0c$\xd6\
+t\x13v\xfez\x86^\x5cOlK \x7f/\xc7 \
+J\x5c\x0b\x89dD\x92\x19\xa8T\xa6\x9cX\x10r\x22\
+\x09TWL*\xf6\xebF\x11I\x02\x89\x01A\x16\xbc\
+ot\x9be\x1d]:\xa8\xf9.\xc8\xae\xcf\xe9tc\
+{N\xdc5\xd7\xa3f\xd9\x9f\x8f\xd5Z\xa7\x9e\xf4\x8e\
+\xd6\xaf\xca}\x9f\xf8\xb0\xa3\x95\x907jE\xb9\xe5\x97\
+e\x9a\xcf\xc9W\xec\xf3w1\x87\xac\x13\x99)Y\xc8\
+\x0fr\xbagu\xc2\xe6\xd7\xa8\xaf\xad\xcb\xd0\x83\x9d\x8b\
+}:\xa73\xd6\xc9\x02\x07?\x1d\xaf\x8e\xa6U\x82\xda\
+A\xdeH\x02\x83\x9e\xbd\x14H\x94\xcfk\xaf4)\xf6\
+\xd6l\x126\x95M\x94Y\xffz4ZY\xe9\xe7b\
+\x9d\x14I\x8a\xaa\xb4\xc3\xc9H\xb2\xe1\xf61,\x9e@\
+\xbe\x85\x9a\xbd\xb5\x12IaH\x90,\x92\x14\xf7\xa31\
+\x0d&\x01!r\xfb*uvT%\xf3p\xa3f\x0e\
+5\xbe\xe4\x1fv\x1a5\x0e\x1b\x8d\xe5\x12a\x9fq\xfc\
+\xda\x93\xda\x17z\xa7\x5c<t\xe0W\x91\x06\xf3\x8f\x05\
+\xec\xffOu\xf5\xbb\xdc\xa7<v\xf1{\x90*I]\
+\x90\x9d\xd3l\xe0\xa0@3 \x99eJjC\xd8)\
+\x0f\xdb\xca\xec3\x06\x8a\xeb^c\xdb\xf4Y\xe4d!\
+_\xd0\xa1\xda\x0d\x0e\xc7\xf4\xb6R\x89\x0aG[w\xef\
+\xd88\xae\x08\xb4\xac\xe1\x8d\xb1L#\x04ga\xc3\x97\
+\xca\x95\x12\x07.j\xe0hN\xe0n\xbc\x14,\x92^\
+,\x19\xe9\xf2\xc0\xb0\xb1\x84r\xa2p0\xb9w\xc8z\
+i\xee\xab\xd8\xf9#\x9d}\xe3\xc7\xa1\x83\xbf\xc70#\
+3\xa0P \xe5\xe4@\x9a\x044s\x12\xb5u\xd5\x5c\
+<p\x08\xf8\x05\xf9\x7f}!\xfbC\xee,\xa4\x1b9\
+\x01iM\x06\x91yx\xb0l$\xcb\x8b\xe2>\xdc\x96\
+\x14\xbc\xf8)\xe5u\x95\xd4\x82*SN\x00\xa6\x8c;\
+\xaf\xbb\xb3\x9fWeG\xd4\x06\x84\xcc\x8e\xc7\x85\xb1[\
+\xba\xbdH\xac\xbdz\xb2\xff\x82\x8a\xb5\xa4\x9ef\x15\x1f\
+\xfcM\xado\x90\xdf\xd9%h)\x12.\x15f+n\
+\xbf\xed[\xa7\x22\xc5\x15\xc3\xd3\xff]\x1dX&\x87J\
+\x9f\xa2\xa2j.\x92\x15\x1dD\x01\x92\x11\x89\x01\x81\xef\
+z\xf6?dN.\xbc\x02\xc5\x03\x22$\xe9\x9d\x1d\xf6\
+\xe6\xa3\xf1\xc7\xd5p\xbbV>\xfd`\xce\x18\xe9\xdbZ\
+\xd6F\x8ds\xce\xb2,\xb7m\xa3sG\xf7\xc3\xbe\xdb\
+\xe3\xa9\x0a/\xd3\xe7\xa0~\x14\xabs\x033\xb5\xd6v\
+wz\x0e*\x16\xf3\xad\x86\xecy\x9eI\xf2\xcaDU\
+@B9\x91\xa8\x09D\xe0\xe1^Q\xd7\xa31\xe6\x1a\
+[\xe6r\xb9`\x14E\xb9\xa7\x0f;\x84cG\x84\xaa\
+\xaa\x82\x9f}}wKM`\xb1\x1dd\x8aJ\x7fN\
+\x07\xb5j\xbb\xa0\xdf*\xb7u\xb4\xc56\x95\xd0\xf3\xe3\
+\xb8\x18\x0c&k\xd8\x19)\xa5\xcf\xd0\xc3\xb8`\xfa\xd3\
+\x192\x22\xb9\xef9\xd4<\xb1gPN.\x01\x82\x1f\
+\xa8r\x8c\xd4!\x86\x86$)HR\x18\xd6r\x18\x08\
+\xe2P\xa2kr\xd2\x07\x92\x80@\x87C\x10\xc3!\x14\
+#\x04\x11\x01Q\x84(2A\x89\x88\xc8H\x92$i\
+\x0c@Ql\x02c\x158\x14d\xbb;\xf7\x952\xab\
+ \xaf\x90p\x15f\x8d\xfc\xee:P\xafmH\xc8\x83\
+\x1a\x99aZ\x1c(\xc5\xb3\xd8\xb1\xbfo\x93=_S\
+\x1bE\xaf6\xbfp\x17(\xc1\x810\xb2\xa8\x15o\xb1\
+\xb8}\x17UG\xd1\x1d'C\x8d\xbe6ys\xc3I\
+\xa3n\x83\xd4\x87&\x14\xe6\xc5Mxl\xb7\x88{\xeb\
+\x88[\xa6,\xfdg\x86D*\xf4\xda\xa7\xe07\xc4\x1d\
+F\xc9 ~\xec/d\x0fU\xb7\xfa\xac\xbc+\xf3\xd3\
+\x17_Q\x94\xe0\x85?e\x97\x01K\xffB';\x96\
+\x10\xa2:\xdbe\x079\x80L\xc2G:\x1e\x90Ng\
+\x0e\x12\xa6\xeeK]\xa9\x8f\xab\xd4\xbc\xe7Yl\xa7c\
+X\x19>\xa7\xed.\xc2\xe0`5(\xc6\x8a\xe9\xedY\
+\xa4\xe0\xa5\x86\x94Yy\xc7\xb7\x87\xf1\x93_DSN\
+/\x9ed\x97\xc3\x8d\x5c\xc0|\x88\xcbi\x9f(\xfe'\
+\xf4\xc2\xcc\xd9\x8d\xea\x1f\xd9\x0a\x09[\xc6\xb7n\x22E\
+Q\xc8\xe0Kl\xc0\x00x\xfc\xed\xa0[\x17\x1c=\x94\
+\x04\x13f\x5c\xa27\xe6\x8d\x8d\x15k\xf3\x99\xdf\x96m\
+K\xc8\xa0\xc3\x13}1^\xc2A\xd9\xb2\xd37m\xc9\
+=8n\xfc\x94\x81\x8d\x93\x0b(\x14\xc8\xe3\x85\xf4\xfc\
+\xd0\x82\xfb\x1aa\x97\x18\xf0h1\xc3\xd41h\xec\xce\
+\x84\xc1\xe8\xf1\x92\x9c\xd5\xc1\xe0x\x15^\x132\xe9A\
+\x1aC\xe4\xe4n\x0b\xfc{!\xcc\xed\x8f\x18\x9fY$\
+\xe6R )\x846\xbb\xa8ngKk\xcd\xd7\xe3\x1d\
+C\xe2\xec\x9dux\x1d=\x0e\x19<@\x98\xc3\xce}\
+0?`\x99\x9a\xd3\xfe\xcc\xf7\xeah_\xd6\x22\x02\xcc\
+Y\xf6 \xa6-g\x05kZ\xa8\xb6\x87\x82\x9bR\xf7\
+\xb2\xb2]\xf5\x02(\x8a\xc2\xd7L\xef\x90p\xa4/\xd0\
+(\x95\x9e\x19\xc7\xbfhk\xca\xd6N\xb5\x00\xe0b\x1c\
+\x8d\xfb\xa2\xc3G\x96\xd6L\xbf\xc3&pH\x10\x1c\xd1\
+D\xf1\xad+\x0c\xb4\xc6\x1b5+\xeft\xa8\xf1\xd4y\
+\xf4\xfa\x5cXK\x88\x95^\x10\xb8\x009d\xd0\x0b6\
+<eG\xe8\x9d\xeb\xc2\xc6\x88\x94V\xb6\x834\xe9k\
+\xfc\xe1\x07N\xf3\xb02\x9c\xd41\x9cd\x98\xdc\x0e^\
+\xa7.\x9a\x04\x88\x0a\xccv\x03\xdcB'\xdc\x14\xe8\x8e\
+iv\xe36\xae\x87\xf1\xc4\xe9\x85\x02\x06\xed\x817P\
+\x19\x5cs\x92\x0cR\x99\x02\xf3(\xd6\xd9\xc0\xe7k<\
+\xed\x8a\xd4\x1283\xa4\xde\x19\xce\x1a\x10J\x0d\x9bA\
+m\xb7ahnB7\xbdc6\xfcR\xb9w\xd3\xc2\
+\xa9\x90|\xef\xbad\xfd\xd9\x91]\xf1?\x85O\xa5P\
+\xfdN\xbah\xc0\xcb\x93\xf6\xf8\x9bF\xf4\x15NJ\x1d\
+\xacbB\x1c\xfc\x8e,\xb8o\xdfH\xf1\x06_u\x0b\
+\xf31\xb6\x92\xe2\x1dZ\xbf\xe3\x22\x86\x0f\x02Ln=\
+\xca\xadnWN\x8bg\x18$\xf0\xf06\x84\x89T\x8c\
+^O\xc7\x18\x83hY 5\x15\xfdqJ\x99\xacW\
+\x80\x98\xf4W.\xf1\xdcz\x97\x09\xbb\x1d:\xc0\xd1\xe9\
++p\xa6\xb3\xd2,|\xdc\x7f!\xc4\xc3\x1f\xb9\x1e/\
+g\x99\xf2\x0f!\xc6\x5cK\x864\xafI\x1c\xf6\xb0|\
+\xd7R\xedGu4\x02 \xf7]B\xe4\x8cUr\xe1\
+\xa5V\xf1a\x09\xea\xbfA\x18\xd5\x16D\x83iQ=\
+\x00\xfdREa \x06\xba\x13z\xe1Y\x8f0Vu\
+b+F\x0a\x0f\xea\x84\x0f\x90\xfd\x9d:\xcb@^\x18\
+\xe8v\xab\x89(\x84\x7fY\xe8(1\x96\x7f\xd2o\xbf\
+\xa0b\xc9\x905\xd7n\xe7\x0b\xaa\xbd\xa9\x11\xd06\xee\
+\xb7\x9fC\x16>\xc8\xb6\xb8E<\x0a\xda(\x90\x13\x09\
+\x98\x7fVm<\x0d&\x5c\x0e\x95\xce\x9c\x8bI\xa4\x96\
+&\x09i\xd8Js\xad1\xe4:f\xa9m\xf8\xe9\x99\
+Tm\x84\x90u\xee\x94\xc9\xf3G\xf0\x0d\x08a\xd7\xe6\
+\xa1\xfb:0{\xc8\x00\x85wb#\xb4\xe7\xbf\xca/\
+\xb5z\x85\x9ey\xecPY\x92\xb8.\x11\xde]\x11\xf8\
+\xb1\xea\xd3\x86\xa1\xdb\xc0\xf2 \x0a\x16g<=\x82\x9e\
+Z\xf9l]\x06\xf6\x1f\xa6Z\xd0]AA\xd3\x113\
+\x06<\xdc\xc3\xac5\x8c\xe6L\xc4\xab\xbfn\xdd\xb1\xcd\
+\xc8M\x08\xbfL\xe7\xcb\x9e\xf2\x19g\xf9\xfb\xca\xb0\xa6\
+\xce\x92\x8a\xe6s\xbepx\xb0p\xf6vf\x89\xd3\x1d\
+\xedh\xb6/\x97\xd5\xd8\xcca\x03\x12*-\x88*\xfd\
+\xeb*6\x0cUX\x88\x9cS\xa0I*\xc1!\x0f\xfc\
+\x82\x0a/N9\xba\xc9E\x5cda\xb2A\xf5^\x96\
+\x02\x85\xb3\xbe\xf7\x1a4\x1f\x92\xcbm\xab\x9fA&A\
+1\x0d\xd9q\x0d\xf0Y)\x03\xcd\x10\x04\xb0\xfb\x94z\
+6@c\x90y`<\xc2\x12\xfcW7\xc9J\xfd\xd0\
+\x80\x1a\xd5\xf31('\xf1\xc9\x1bp\x87+\xb2\x1ad\
+F\x22\x8d9\x9en\xc4\x07\x87J\x88O\x8c\x03\x1f\xc9\
+E4\xc8\xa2\xcd\xaa\xac\x8d!\x7fv\x1e\xadK\xf0\xea\
+/\x1c\xa7U6\x85\x83\xd5\xf8\xd3\xfd\x5c\xea\x90\xf9<\
+\x5c\xebQ\xb4\x02\
 \x00\x00\x10\xbe\
 \x00\
 \x00\x01\x00\x01\x00  \x00\x00\x01\x00 \x00\xa8\x10\x00\
@@ -381,41 +510,41 @@ p1\x8e\xaa\x8c\x22\x87`\xc6po\x1cU\x1bE\x0e\
 \x01\x00\x00\x00\x00\xd2==\xfd\x07\x83G_\xfb\xf2T\
 M\xb2\x00\x00\x00\x00IEND\xaeB`\x82\
 \x00\x00\x02\x12\
-\x00\
-\x00\x0b\xa7x\xda\xeb\x0c\xf0s\xe7\xe5\x92\xe2b``\
-\xe0\xf5\xf4p\x09b``J\x06b{\x0e6\xa0\x88\
-u\xcb\xbd\x8f@\x8a\xb18\xc8\xdd\x89a\xdd9\x99\x97\
-@\x0eK\xba\xa3\xaf#\x03\xc3\xc6~\xee?\x89\xac@\
->g\x81Gd1\x03\x03\xdf!\x10f\x14\xd5\xf0j\
-\x00\x0aJ\x94\xb8F\x94\x04\xe7\xa7\x95\x94'\x16\xa52\
-\x04$f\xe6\x95\xe8\xf9\xb9\x86(\x98\xea\x19\xeaYH\
-g\xbeZ\x01T\xb3-5\xc23\xcd\xd3S\x8b\x81\x03\
-\xc8ae\x90bde`\x04\xb2\xbc\x80X\x1a\xca\x06\
-\xba\x86A\x83\x91\x19\xccf\x02bCF&\x06\x01 \
-\x1d\x05\xc4\x99\xed,`\xf1,\x06\x08\xf8T\xc6\xc8\xf0\
-\x82\x19A\xa3Y\xca\x00\x14\x9a\xc0\xce\xc0\x02Ti`\
-dl\xc0\xb8\x00b*\x08\xb3.\x80\x984\x05j\x12\
-\x13\x90\xc7\x04V\x19di\x01dAu\x19\x1a\x18\x80\
-d\xcf\xe4\x89\xd5x\x05\xbf\x90a`\xe0\x0a\xf3tq\
-\x0c\xa9\x88{{sc\xaeR\xa0\x88C\xe0f\xdb\x09\
-V\x8bD\xb4\x1cJ\x1e\xcad5\xdc\x89U\xd0Z \
-\xa2\xb4\xdcdc\xfc\xac\x8b\xc7\xee\xbd\xc8j+^\xb2\
-\xfe{\x1ck\x8c\x89<\x03\xd5\xc1\x81K9\xcf8\xd7\
-\xdc\xf9\xf8\xf1Vo\xe1\x0c=\xb1\x17u\xb7\xf3\xe7\x7f\
-\xe6[\xd3!\xd1ln\x98\xf4\xc6\xe4X\xea\xae\x88\x05\
-\x9f;6\xbe\xde\xc3\xac\xfd)}\x1e0\x12\x8fH0\
-8x\xf402\xb4\x8c2F\x19\xa3\x0c\x92\x19\x19\xc6\
-\xe7\x8fZ\xda\xc5\xed6\xe4\xbb\xcc\xfa\xe7\xd0\xf3\x8a\xf8\
-\xcb\xa7\x98j\xfb\xbf\x1b\xaf\xfd`\xf6n\xfb\xdfo\x96\
-\xefWo}\x22a\xdd[8S\x8f!\xa1\xf5\x9c\xf2\
-\xb1u\x9f\xf7E\xd9\x053\x8d\x06\xdch\x12AJ\x22\
-7$\x98\xff\x9d\xff\xc1\x5c,\xf5\xd8(V\xe7B\xe5\
-\x1f\x8d\xd8\xe7\xb2\x11\x82\xf35\x19\x19\x9c\x92x\x18\x14\
-T\x8e1\x8c2F\x19\xa3\x8cA\xc3\x98]\xc9\xa4]\
-^\xb3\xa7,YfY7\xeb\xae\xfb\xdfn?\xdf\xc3\
-L\xcdv\xdc\xff\x9a\x9a?\xac\x0f.h}\xbaX\xf7\
-\xee!H\xc0\xd3\xd5\xcfe\x9dSB\x13\x00\x9d5\xd2\
-\xab\
+(\
+\xb5/\xfd`\xa7\x0aE\x10\x00\xa6\xdet4\x90t\xad\
+\x012\xc0,\xf2\xc4\xb3\xd1O\x82|R\x9e\x91\x87\x01\
+\xc9\xfc \x99\x90\x07\x9e\x9b\x04\xbd\xb2s\xef\xce\x91\xb6\
+z\xb8\x04{m\xe3~yK\x91\xc4\xab&\x89\x942\
+\x05d\x00R\x00s\x009\xdd/\x0e\xdb\x7f2F\x9e\
+\x05\x0c\xac\x16[Qe\x19A\xc1\x86\x81xjR\x8e\
+CTc\x14\xce\x09Z\x09\x7fG\xc2\xd2\xffK&\xd6\
+\x04z\x0e\xfa\x83]J\x84\x06\xfe\xdf5g\x82+\xf2\
+\x0fr\x02\xa2\xe3\xfc\xbfH\xc5C{\x08\x89\x17L\xff\
+\x9f\x1ct\xda\xf8\x0f \xe0Q\xff7\xf5\xef\x15)\xe9\
+\x1a\xfc\x7fN\x9f\x06$()S\x01G, \x22\xdd\
+\x96\xe7O5\xaf\x98\x88\x15\x80\xee\xfe?\x9b\xd5\xbe>\
+F\x86\xf7\xbf\xf3\xf5\xe9\xd7Y\xe3{Lg\xb7\x14\xd9\
+\xff\xce\x07`\xfd\xf6m\xf3\xe9\x22\xca\xff\xff\xdf\xe3\x8c\
+\xe2\xf9\xff\xf2\xff\xe05\xad\xfd_\xdb\xb4\xf5\xbfw\xe1\
+\xbf\xc9\x7f\xfa7=\xfd\xfd_\xe0\xd7n7s\xe7\xbb\
+\x0f\xaa}\x93\xe9\xc8\xa8\xcb\xdb\xee8\x9d\xae*\xf9\xb8\
+\x94\xce\xf9{\xe9PJ\xd8p\x8dd\xa9\xca\xf1\xd7\x0d\
+\xa7\xccu\xb4\xd1^4I\xa5\xcc\xa0\x95_A\x81J\
+f\x05\xac\xd6\x90\x15\xe0\xe4\xa4\xa0\xd9@\xa2\x0f\x9f\xdc\
+\x1b\xb80\xb7\xcceZ\x18\x18\xaa\xc7<X\xde\xe3\x9a\
+!s\xc7\x1c\xa2\xe3k5Fp\xa9\x87j\x18\xfe\xb8\
+F\xc14\xb08\xd4T>\xa2*\x0e?\xe4\xbfG\x99\
+L4!h\x22(#\xdd\xff7\x84T\xda\xa3\xbc\xea\
+\x15\xdeg\xb1x\xf36\x9cb\xa0%\xa1\xdbM%F\
+\xbd)\x82\x13\x1bI\xd4H]/CT_`\x13r\
+:\xe2\x0b\xe1\xcb\xa0\x18c=#\xe9M\xc4P\x1cN\
+\xc16f\x9e\xa6-\xf5\xabW:^\xe2*\xd1\xca\x0f\
+xO4\xc7n\x0dYmH\x11\xd7\xca\x223,3\
+\xdb -$\xcf\xb6\x97WI\xb5]\xdf\xcc\x91b\x11\
+\x00\x11\x8721~\xabgB\x90\xe0\xd2\xe7\x0a\x15*\
+M\x96\x0a\x16\xc7\xa1#+\x07\xc0\x89& \xee-\xcc\
+BX< `\xa5\xd4\x9d\x17@[\xe4\xc5\x8fb\xbd\
+Q\
 \x00\x00\x06R\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -1421,6 +1550,14 @@ qt_resource_name = b"\
 \x00o\xa6S\
 \x00i\
 \x00c\x00o\x00n\x00s\
+\x00\x03\
+\x00\x00x\xa3\
+\x00q\
+\x00s\x00s\
+\x00\x0f\
+\x0b\xe6.#\
+\x00m\
+\x00a\x00i\x00n\x00_\x00w\x00i\x00n\x00d\x00o\x00w\x00.\x00q\x00s\x00s\
 \x00\x08\
 \x0aaB\x7f\
 \x00i\
@@ -1448,24 +1585,30 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0a\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x03\
+\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x18\xac\
+\x00\x00\x01\x9d\xbaiOH\
+\x00\x00\x00l\x00\x04\x00\x00\x00\x01\x00\x00\x1f\x0f\
+\x00\x00\x01\x9d\xbaiOH\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00J\x86\
+\x00\x00\x01\x9d\xbaiOH\
+\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00\x07\xea\
+\x00\x00\x01\x9d\xbaiOH\
+\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00!%\
+\x00\x00\x01\x9d\xbaiOH\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00'{\
+\x00\x00\x01\x9d\xbaiOH\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0b\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x10\xc2\
-\x00\x00\x01\x97}\x1c\xb5D\
-\x00\x00\x00<\x00\x01\x00\x00\x00\x01\x00\x00\x17%\
-\x00\x00\x01\x97}\x1b\x157\
-\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00B\x9c\
-\x00\x00\x01\x97}\x1a\xcbf\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x98z}\xe0B\
-\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x19;\
-\x00\x00\x01\x97}\x18A\x1a\
-\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x91\
-\x00\x00\x01\x98z;\x9f\xff\
+\x00\x00\x00\x1c\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1KD\xbb!\
 "
 
 def qInitResources():
@@ -3,6 +3,7 @@ from __future__ import annotations
 """Template management for cross-section images and default project data."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -12,6 +13,25 @@ def get_resource_path() -> Path:
     return Path(__file__).parent
 
 
+@lru_cache(maxsize=None)
+def get_stylesheet(name: str) -> str:
+    """Return the Qt stylesheet ``qss/<name>.qss`` from the compiled resources.
+
+    The text is read once per process and cached, so every window reuses the
+    same decoded string. Returns an empty string if the resource is missing.
+    """
+    from PySide6.QtCore import QFile
+    from . import resources_rc  # noqa: F401  (registers the :/qss resources)
+
+    qss_file = QFile(f":/qss/qss/{name}.qss")
+    if not qss_file.open(QFile.ReadOnly | QFile.Text):
+        return ""
+    try:
+        return bytes(qss_file.readAll()).decode("utf-8")
+    finally:
+        qss_file.close()
+
+
 def get_crosssection_templates() -> Dict[str, Path]:
     """Return available cross-section template images."""
     resource_dir = get_resource_path()
@@ -136,18 +156,18 @@ standard_flight_routes = {
 }
 
 flight_speed_map = {
-    "101": {"speed": "6"}, "102": {"speed": "4"},
-    "201": {"speed": "6"}, "202": {"speed": "4"},
-    "103": {"speed": "3"}, "203": {"speed": "3"},
-    "104": {"speed": "3"}, "105": {"speed": "2"},
-    "204": {"speed": "3"}, "205": {"speed": "2"},
-    "underdeck_1": {"speed": "0.8"},
-    "underdeck_2": {"speed": "1.0"},
-    "underdeck_3": {"speed": "0.8"},
-    "axial_underdeck_1": {"speed": "1.0"},
-    "axial_underdeck_2": {"speed": "1.0"},
-    "axial_underdeck_3": {"speed": "1.0"},
-    "underdeck_safe_flythrough": {"speed": "2"}
+    "101": {"speed": 6}, "102": {"speed": 4},
+    "201": {"speed": 6}, "202": {"speed": 4},
+    "103": {"speed": 3}, "203": {"speed": 3},
+    "104": {"speed": 3}, "105": {"speed": 2},
+    "204": {"speed": 3}, "205": {"speed": 2},
+    "underdeck_1": {"speed": 0.8},
+    "underdeck_2": {"speed": 1.0},
+    "underdeck_3": {"speed": 0.8},
+    "axial_underdeck_1": {"speed": 1.0},
+    "axial_underdeck_2": {"speed": 1.0},
+    "axial_underdeck_3": {"speed": 1.0},
+    "underdeck_safe_flythrough": {"speed": 2}
 }
 """
 